@@ -12,13 +12,21 @@ import gzip
 import json
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 from .log import log
+from ..components import COMPONENT_MODULES
 
 
 def import_from_directories(module_name, base_path=None):
-    dirs = sys.path
-    if base_path:
+    # Search a copy - appending to sys.path itself would add base_path again on
+    # every call and slow down every import after it
+    dirs = list(sys.path)
+    if base_path and base_path not in dirs:
         dirs.append(base_path)
     for path in dirs:
         dirs = [path]
@@ -100,6 +108,12 @@ def resolve_config_values(config, allow_source_expression=False):
     return config
 
 
+# Short module names that were only found under one of the known prefixes in
+# import_module. Remembering where they were found skips the failed imports that
+# every later lookup of the same name would otherwise repeat
+_prefixed_module_cache = {}
+
+
 def import_module(module, base_path=None, component_package=None):
     """Import a module by name or return the module object if it's already imported"""
 
@@ -112,6 +126,11 @@ def import_module(module, base_path=None, component_package=None):
     if base_path:
         if base_path not in sys.path:
             sys.path.append(base_path)
+
+    cached = _prefixed_module_cache.get((module, base_path))
+    if cached:
+        return cached
+
     try:
         return importlib.import_module(module)
     except ModuleNotFoundError as exc:
@@ -119,6 +138,17 @@ def import_module(module, base_path=None, component_package=None):
         # importing it from the known prefixes - annoying that this
         # is necessary. It seems you can't dynamically import a module
         # that is listed in an __init__.py file :(
+        if "." not in module and module in COMPONENT_MODULES:
+            # Built-in components have a known location, so go straight there
+            full_name = f"solace_ai_connector.components{COMPONENT_MODULES[module]}"
+            try:
+                imported = importlib.import_module(full_name)
+            except ModuleNotFoundError:
+                raise
+            except Exception as e:
+                raise ImportError(f"Module load error for {full_name}: {e}") from e
+            _prefixed_module_cache[(module, base_path)] = imported
+            return imported
         if "." not in module:
             for prefix_prefix in ["solace_ai_connector", "."]:
                 for prefix in [
@@ -136,11 +166,13 @@ def import_module(module, base_path=None, component_package=None):
                     full_name = f"{prefix_prefix}{prefix}.{module}"
                     try:
                         if full_name.startswith("."):
-                            return importlib.import_module(
+                            imported = importlib.import_module(
                                 full_name, package=__package__
                             )
                         else:
-                            return importlib.import_module(full_name)
+                            imported = importlib.import_module(full_name)
+                        _prefixed_module_cache[(module, base_path)] = imported
+                        return imported
                     except ModuleNotFoundError as e:
                         name = str(e.name)
                         if (
@@ -264,12 +296,24 @@ def call_function(function, params, allow_source_expression):
     return function(**params)
 
 
+# Packages that install_package has already checked or installed. A pip package
+# name need not be importable (e.g. python-dateutil), so without this every
+# component instance using it would run pip again
+_installed_packages = set()
+
+
 def install_package(package_name):
     """Install a package using pip if it isn't already installed"""
+    if package_name in _installed_packages:
+        return
     try:
         importlib.import_module(package_name)
     except ImportError:
-        subprocess.run(["pip", "install", package_name], check=True)
+        subprocess.run(
+            [sys.executable, "-m", "pip", "install", package_name], check=True
+        )
+        importlib.invalidate_caches()
+    _installed_packages.add(package_name)
 
 
 def extract_evaluate_expression(se_call):
@@ -384,8 +428,22 @@ def decode_payload(payload, encoding, payload_format):
         payload = payload.decode('unicode_escape')
 
     if payload_format == "json":
-        payload = json.loads(payload)
+        payload = json_loads(payload)
     elif payload_format == "yaml":
         payload = yaml.safe_load(payload)
 
     return payload
+
+
+def json_loads(data):
+    """Parse JSON with orjson when it is installed, falling back to json.
+
+    orjson is several times faster on large payloads, but it rejects the
+    NaN and Infinity literals that json accepts, so those fall back.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
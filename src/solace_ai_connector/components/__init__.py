@@ -1,81 +1,86 @@
-# Consolidate all components in one place
+"""Consolidate all components in one place
 
-from .inputs_outputs import (
-    error_input,
-    timer_input,
-    broker_input,
-    broker_output,
-    stdout_output,
-    stdin_input,
-)
+The components are imported on first access rather than when the package is
+imported. Importing the LLM components pulls in litellm and langchain, which
+take seconds to load, and every connector imports this package through
+component_base whether or not its flows use them.
+"""
 
-from .general import (
-    user_processor,
-    aggregate,
-    pass_through,
-    delay,
-    iterate,
-    message_filter,
-    parser,
-)
+import importlib
 
-from .general.for_testing import (
-    need_ack_input,
-    fail,
-    give_ack_output,
-)
+# Component modules, by the name they are exposed under. import_module also
+# uses this to find built-in components without probing every package
+COMPONENT_MODULES = {
+    "error_input": ".inputs_outputs.error_input",
+    "timer_input": ".inputs_outputs.timer_input",
+    "broker_input": ".inputs_outputs.broker_input",
+    "broker_output": ".inputs_outputs.broker_output",
+    "stdout_output": ".inputs_outputs.stdout_output",
+    "stdin_input": ".inputs_outputs.stdin_input",
+    "user_processor": ".general.user_processor",
+    "aggregate": ".general.aggregate",
+    "pass_through": ".general.pass_through",
+    "delay": ".general.delay",
+    "iterate": ".general.iterate",
+    "message_filter": ".general.message_filter",
+    "parser": ".general.parser",
+    "need_ack_input": ".general.for_testing.need_ack_input",
+    "fail": ".general.for_testing.fail",
+    "give_ack_output": ".general.for_testing.give_ack_output",
+    "langchain_embeddings": ".general.llm.langchain.langchain_embeddings",
+    "langchain_vector_store_delete": ".general.llm.langchain.langchain_vector_store_delete",
+    "langchain_chat_model": ".general.llm.langchain.langchain_chat_model",
+    "langchain_chat_model_with_history": ".general.llm.langchain.langchain_chat_model_with_history",
+    "langchain_vector_store_embedding_index": ".general.llm.langchain.langchain_vector_store_embedding_index",
+    "langchain_vector_store_embedding_search": ".general.llm.langchain.langchain_vector_store_embedding_search",
+    "litellm_chat_model": ".general.llm.litellm.litellm_chat_model",
+    "litellm_embeddings": ".general.llm.litellm.litellm_embeddings",
+    "litellm_chat_model_with_history": ".general.llm.litellm.litellm_chat_model_with_history",
+    "websearch_duckduckgo": ".general.websearch.websearch_duckduckgo",
+    "websearch_google": ".general.websearch.websearch_google",
+    "websearch_bing": ".general.websearch.websearch_bing",
+}
 
-from .general.llm.langchain import (
-    langchain_embeddings,
-    langchain_vector_store_delete,
-    langchain_chat_model,
-    langchain_chat_model_with_history,
-    langchain_vector_store_embedding_index,
-    langchain_vector_store_embedding_search,
-)
+# Component classes and the modules that define them
+_CLASSES = {
+    "ErrorInput": ".inputs_outputs.error_input",
+    "TimerInput": ".inputs_outputs.timer_input",
+    "BrokerInput": ".inputs_outputs.broker_input",
+    "BrokerOutput": ".inputs_outputs.broker_output",
+    "Stdout": ".inputs_outputs.stdout_output",
+    "Stdin": ".inputs_outputs.stdin_input",
+    "UserProcessor": ".general.user_processor",
+    "Aggregate": ".general.aggregate",
+    "NeedAckInput": ".general.for_testing.need_ack_input",
+    "Fail": ".general.for_testing.fail",
+    "GiveAckOutput": ".general.for_testing.give_ack_output",
+    "PassThrough": ".general.pass_through",
+    "Delay": ".general.delay",
+    "Iterate": ".general.iterate",
+    "MessageFilter": ".general.message_filter",
+    "Parser": ".general.parser",
+    "LangChainBase": ".general.llm.langchain.langchain_base",
+    "LangChainEmbeddings": ".general.llm.langchain.langchain_embeddings",
+    "LangChainVectorStoreDelete": ".general.llm.langchain.langchain_vector_store_delete",
+    "LangChainChatModel": ".general.llm.langchain.langchain_chat_model",
+    "LangChainChatModelWithHistory": ".general.llm.langchain.langchain_chat_model_with_history",
+    "LangChainVectorStoreEmbeddingsIndex": ".general.llm.langchain.langchain_vector_store_embedding_index",
+    "LangChainVectorStoreEmbeddingsSearch": ".general.llm.langchain.langchain_vector_store_embedding_search",
+    "WebSearchDuckDuckGo": ".general.websearch.websearch_duckduckgo",
+    "WebSearchGoogle": ".general.websearch.websearch_google",
+    "WebSearchBing": ".general.websearch.websearch_bing",
+}
 
-from .general.llm.litellm import (
-    litellm_chat_model,
-    litellm_embeddings,
-    litellm_chat_model_with_history,
-)
+__all__ = list(COMPONENT_MODULES) + list(_CLASSES)
 
-from .general.websearch import (
-    websearch_duckduckgo,
-    websearch_google,
-    websearch_bing
-)
 
-# Also import the components from the submodules
-from .inputs_outputs.error_input import ErrorInput
-from .inputs_outputs.timer_input import TimerInput
-from .inputs_outputs.broker_input import BrokerInput
-from .inputs_outputs.broker_output import BrokerOutput
-from .inputs_outputs.stdout_output import Stdout
-from .inputs_outputs.stdin_input import Stdin
-from .general.user_processor import UserProcessor
-from .general.aggregate import Aggregate
-from .general.for_testing.need_ack_input import NeedAckInput
-from .general.for_testing.fail import Fail
-from .general.for_testing.give_ack_output import GiveAckOutput
-from .general.pass_through import PassThrough
-from .general.delay import Delay
-from .general.iterate import Iterate
-from .general.message_filter import MessageFilter
-from .general.parser import Parser
-from .general.llm.langchain.langchain_base import LangChainBase
-from .general.llm.langchain.langchain_embeddings import LangChainEmbeddings
-from .general.llm.langchain.langchain_vector_store_delete import LangChainVectorStoreDelete
-from .general.llm.langchain.langchain_chat_model import LangChainChatModel
-from .general.llm.langchain.langchain_chat_model_with_history import (
-    LangChainChatModelWithHistory,
-)
-from .general.llm.langchain.langchain_vector_store_embedding_index import (
-    LangChainVectorStoreEmbeddingsIndex,
-)
-from .general.llm.langchain.langchain_vector_store_embedding_search import (
-    LangChainVectorStoreEmbeddingsSearch,
-)
-from .general.websearch.websearch_duckduckgo import WebSearchDuckDuckGo
-from .general.websearch.websearch_google import WebSearchGoogle
-from .general.websearch.websearch_bing import WebSearchBing
\ No newline at end of file
+def __getattr__(name):
+    if name in COMPONENT_MODULES:
+        value = importlib.import_module(COMPONENT_MODULES[name], __name__)
+    elif name in _CLASSES:
+        value = getattr(importlib.import_module(_CLASSES[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache it so that later lookups don't come back through here
+    globals()[name] = value
+    return value
@@ -12,9 +12,15 @@ from ..common.trace_message import TraceMessage
 from ..common.event import Event, EventType
 from ..flow.request_response_flow_controller import RequestResponseFlowController
 
-DEFAULT_QUEUE_TIMEOUT_MS = 1000
 DEFAULT_QUEUE_MAX_DEPTH = 5
 
+# We reserve a few callable function names for internal use
+# They are used for the handler_callback component which is used
+# in testing (search the tests directory for example uses)
+RESERVED_CALLABLE_CONFIG_KEYS = frozenset(
+    ["invoke_handler", "get_next_event_handler", "send_message_handler"]
+)
+
 
 class ComponentBase:
 
@@ -46,9 +52,10 @@ class ComponentBase:
 
         self.next_component = None
         self.thread = None
-        self.queue_timeout_ms = DEFAULT_QUEUE_TIMEOUT_MS
+        # None blocks on the input queue until there is an event. Stopping the
+        # connector wakes the thread with wake_up(), so there is nothing to poll
+        self.queue_timeout_ms = None
         self.need_acknowledgement = False
-        self.stop_thread_event = threading.Event()
         self.current_message = None
         self.current_message_has_been_discarded = False
 
@@ -106,8 +113,15 @@ class ComponentBase:
             return None
         while not self.stop_signal.is_set():
             try:
-                timeout = self.queue_timeout_ms or DEFAULT_QUEUE_TIMEOUT_MS
-                event = self.input_queue.get(timeout=timeout / 1000)
+                timeout = (
+                    self.queue_timeout_ms / 1000 if self.queue_timeout_ms else None
+                )
+                event = self.input_queue.get(timeout=timeout)
+                if event is None:
+                    # A wake_up() sentinel. Sibling instances share this queue
+                    # and may be blocked on it too, so pass it on to the next one
+                    self.wake_up()
+                    return None
                 log.debug(
                     "%sComponent received event %s from input queue",
                     self.log_identifier,
@@ -229,14 +243,7 @@ class ComponentBase:
         if val is None:
             val = self.config.get(key, default)
 
-        # We reserve a few callable function names for internal use
-        # They are used for the handler_callback component which is used
-        # in testing (search the tests directory for example uses)
-        if callable(val) and key not in [
-            "invoke_handler",
-            "get_next_event_handler",
-            "send_message_handler",
-        ]:
+        if callable(val) and key not in RESERVED_CALLABLE_CONFIG_KEYS:
             if self.current_message is None:
                 raise ValueError(
                     f"Component {self.log_identifier} is trying to use an `invoke` config "
@@ -272,6 +279,9 @@ class ComponentBase:
     def kv_store_set(self, key, value):
         self.flow_kv_store.set(key, value)
 
+    def kv_store_delete(self, key):
+        self.flow_kv_store.delete(key)
+
     def setup_communications(self):
         self.queue_max_depth = self.config.get(
             "component_queue_max_depth", DEFAULT_QUEUE_MAX_DEPTH
@@ -416,6 +426,18 @@ class ComponentBase:
         # This should be overridden by the component if needed
         pass
 
+    def wake_up(self):
+        """Unblock a thread waiting on the input queue so it sees the stop signal.
+        The thread that takes the sentinel puts it back for its siblings, so one
+        sentinel wakes every instance that shares the queue"""
+        try:
+            self.input_queue.put_nowait(None)
+        except queue.Full:
+            # Only an empty queue can have threads blocked on it. A full one is
+            # drained by threads that check the stop signal before each read,
+            # and any sentinel in it is passed on when it is taken
+            pass
+
     def cleanup(self):
         """Clean up resources used by the component"""
         log.debug("%sCleaning up component", self.log_identifier)
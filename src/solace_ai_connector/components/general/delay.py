@@ -1,7 +1,6 @@
 """A simple component that simply passes the input to the output, but with a configurable delay"""
 
 from copy import deepcopy
-from time import sleep
 from ..component_base import ComponentBase
 
 
@@ -39,5 +38,8 @@ class Delay(ComponentBase):
 
     def invoke(self, message, data):
         delay = self.get_config("delay")
-        sleep(delay)
+        # Wait on the stop signal rather than sleeping, so that stopping the
+        # connector doesn't have to wait for the delay to pass
+        if self.stop_signal.wait(delay):
+            return None
         return deepcopy(data)
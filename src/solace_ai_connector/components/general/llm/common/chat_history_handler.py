@@ -1,37 +1,101 @@
 """Generic chat history handler."""
 
 import time
+from itertools import islice
 from ....component_base import ComponentBase
 from .....common.log import log
 
+# Sessions are locked through a fixed set of striped locks. Unrelated sessions
+# rarely share a stripe, and the number of locks stays bounded however many
+# sessions come and go
+HISTORY_LOCK_STRIPES = 64
+
+
 class ChatHistoryHandler(ComponentBase):
     def __init__(self, info, **kwargs):
         super().__init__(info, **kwargs)
         self.history_max_turns = self.get_config("history_max_turns", 10)
         self.history_max_time = self.get_config("history_max_time", 3600)
+        # Each session's history is stored under its own key so that a turn
+        # only rewrites that session. The history_key itself holds the set of
+        # session ids, which is only rewritten when a session comes or goes
         self.history_key = f"{self.flow_name}_{self.name}_history"
 
         # Set up hourly timer for history cleanup
         self.add_timer(3600000, "history_cleanup", interval_ms=3600000)
 
-    def prune_history(self, session_id, history):
-        current_time = time.time()
+    def get_session_history_key(self, session_id):
+        return f"{self.history_key}:{session_id}"
+
+    def get_session_lock(self, session_id):
+        """Return the lock guarding a session's history.
+
+        A caller holding it may take the history_key lock, but never the
+        other way round.
+        """
+        stripe = hash(session_id) % HISTORY_LOCK_STRIPES
+        return self.get_lock(f"{self.history_key}_lock_{stripe}")
+
+    def load_session_history(self, session_id, now=None):
+        """Return the stored history of a session, creating it if it is new.
+
+        Must be called with the session lock held.
+        """
+        session = self.kv_store_get(self.get_session_history_key(session_id))
+        if session is None:
+            session = {
+                "messages": [],
+                "last_accessed": time.time() if now is None else now,
+            }
+            with self.get_lock(self.history_key):
+                sessions = self.kv_store_get(self.history_key) or set()
+                sessions.add(session_id)
+                self.kv_store_set(self.history_key, sessions)
+        return session
+
+    def store_session_history(self, session_id, session):
+        self.kv_store_set(self.get_session_history_key(session_id), session)
+
+    def add_messages_to_history(self, session_history, messages):
+        """Append the new messages to a session's history in place.
+
+        The system message, if any, is only ever at the head of the history, so
+        a new one replaces it there rather than being appended.
+        """
+        if (
+            messages
+            and messages[0]["role"] == "system"
+            and session_history
+            and session_history[0]["role"] == "system"
+        ):
+            session_history[0] = messages[0]
+            session_history.extend(islice(messages, 1, None))
+        else:
+            session_history.extend(messages)
+
+    def prune_history(self, session_id, history, now=None):
+        # The messages are trimmed in place rather than replaced by a new list
+        messages = history[session_id]["messages"]
+        max_messages = self.history_max_turns * 2
+        current_time = time.time() if now is None else now
         if current_time - history[session_id]["last_accessed"] > self.history_max_time:
-            history[session_id]["messages"] = []
-        elif len(history[session_id]["messages"]) > self.history_max_turns * 2:
-            history[session_id]["messages"] = history[session_id]["messages"][
-                -self.history_max_turns * 2 :
-            ]
-        log.debug(f"Pruned history for session {session_id}")
+            messages.clear()
+        elif len(messages) > max_messages:
+            del messages[:-max_messages]
+        log.debug("Pruned history for session %s", session_id)
         self.make_history_start_with_user_message(session_id, history)
 
-    def clear_history_but_keep_depth(self, session_id: str, depth: int, history):
+    def clear_history_but_keep_depth(
+        self, session_id: str, depth: int, history, now=None
+    ):
+        if now is None:
+            now = time.time()
         if session_id in history:
             messages = history[session_id]["messages"]
             # If the depth is 0, then clear all history
             if depth == 0:
-                history[session_id]["messages"] = []
-                history[session_id]["last_accessed"] = time.time()
+                messages.clear()
+                history[session_id]["last_accessed"] = now
                 return
 
             # Check if the history is already shorter than the depth
@@ -43,13 +107,13 @@ class ChatHistoryHandler(ComponentBase):
             # increment the depth until a user message is found
             while depth < len(messages) and messages[-depth]["role"] != "user":
                 depth += 1
-            history[session_id]["messages"] = messages[-depth:]
-            history[session_id]["last_accessed"] = time.time()
+            del messages[:-depth]
+            history[session_id]["last_accessed"] = now
 
             # In the unlikely case that the history starts with a non-user message,
             # remove it
             self.make_history_start_with_user_message(session_id, history)
-            log.info(f"Cleared history for session {session_id}")
+            log.info("Cleared history for session %s", session_id)
 
     def make_history_start_with_user_message(self, session_id, history):
         if session_id in history:
@@ -62,11 +126,14 @@ class ChatHistoryHandler(ComponentBase):
                     # Start from the first message otherwise
                     start_index = 0
 
+                # Find the first user message and drop everything before it
+                # in a single slice deletion rather than popping one by one
+                end_index = start_index
                 while (
-                    start_index < len(messages)
-                    and messages[start_index]["role"] != "user"
+                    end_index < len(messages) and messages[end_index]["role"] != "user"
                 ):
-                    messages.pop(start_index)
+                    end_index += 1
+                del messages[start_index:end_index]
 
     def handle_timer_event(self, timer_data):
         if timer_data["timer_id"] == "history_cleanup":
@@ -74,13 +141,20 @@ class ChatHistoryHandler(ComponentBase):
 
     def history_age_out(self):
         with self.get_lock(self.history_key):
-            history = self.kv_store_get(self.history_key) or {}
-            current_time = time.time()
-            for session_id in list(history.keys()):
+            session_ids = list(self.kv_store_get(self.history_key) or ())
+        current_time = time.time()
+        for session_id in session_ids:
+            # Take the session lock first, in the same order as invoke does
+            with self.get_session_lock(session_id):
+                session_key = self.get_session_history_key(session_id)
+                session = self.kv_store_get(session_key)
                 if (
-                    current_time - history[session_id]["last_accessed"]
-                    > self.history_max_time
+                    session is None
+                    or current_time - session["last_accessed"] > self.history_max_time
                 ):
-                    del history[session_id]
-                    log.info(f"Removed history for session {session_id}")
-            self.kv_store_set(self.history_key, history)
+                    self.kv_store_delete(session_key)
+                    with self.get_lock(self.history_key):
+                        sessions = self.kv_store_get(self.history_key) or set()
+                        sessions.discard(session_id)
+                        self.kv_store_set(self.history_key, sessions)
+                    log.info("Removed history for session %s", session_id)
@@ -5,6 +5,11 @@ import importlib
 from ....component_base import ComponentBase
 from .....common.utils import resolve_config_values
 
+# LangChain classes already loaded, by (module path, class name). Every
+# instance of a component loads the same class, so only the first one needs to
+# go through the import machinery
+_component_classes = {}
+
 
 class LangChainBase(ComponentBase):
     def __init__(self, module_info, **kwargs):
@@ -27,12 +32,15 @@ class LangChainBase(ComponentBase):
         self.component = self.create_component(self.lc_config, self.component_class)
 
     def load_component(self, path, name):
-        component_class = None
+        component_class = _component_classes.get((path, name))
+        if component_class is not None:
+            return component_class
         try:
             module = importlib.import_module(path)
             component_class = getattr(module, name)
         except Exception as e:
             raise ImportError("Unable to load component: " + str(e)) from e
+        _component_classes[(path, name)] = component_class
         return component_class
 
     def create_component(self, config, cls):
@@ -11,9 +11,8 @@ litellm_info_base = {
     "config_parameters": [
         {
             "name": "load_balancer",
-            "required": False,
+            "required": True,
             "description": ("Add a list of models to load balancer."),
-            "default": "",
         },
         {
             "name": "embedding_params",
@@ -63,12 +62,42 @@ class LiteLLMBase(ComponentBase):
 
     def init_load_balancer(self):
         """initialize a load balancer"""
+        self.validate_model_config(self.load_balancer)
+        # A router loads the certifi bundle into a new SSL context for each
+        # client it creates, which takes far longer than anything else in
+        # component setup. The instances of one component share theirs
+        sibling = self.sibling_component
+        if (
+            isinstance(sibling, LiteLLMBase)
+            and sibling.router is not None
+            and sibling.load_balancer == self.load_balancer
+        ):
+            self.router = sibling.router
+            return
         try:
             self.router = litellm.Router(model_list=self.load_balancer)
             log.debug("Load balancer initialized with models: %s", self.load_balancer)
         except Exception as e:
             raise ValueError(f"Error initializing load balancer: {e}")
 
+    def validate_model_config(self, config):
+        """validate the load balancer model list before handing it to litellm"""
+        if not isinstance(config, list) or not config:
+            raise ValueError("'load_balancer' must be a non-empty list of models")
+        for index, entry in enumerate(config):
+            model_name = entry.get("model_name") if isinstance(entry, dict) else None
+            if not model_name:
+                raise ValueError(f"Missing 'model_name' in load_balancer entry {index}")
+            params = entry.get("litellm_params")
+            if not isinstance(params, dict):
+                raise ValueError(
+                    f"Missing 'litellm_params' for load_balancer model '{model_name}'"
+                )
+            if not params.get("model"):
+                raise ValueError(
+                    f"Missing 'model' in 'litellm_params' for load_balancer model '{model_name}'"
+                )
+
     def load_balance(self, messages, stream):
         """load balance the messages"""
         response = self.router.completion(
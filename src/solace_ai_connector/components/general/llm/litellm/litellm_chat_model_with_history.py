@@ -36,13 +36,9 @@ info["input_schema"]["properties"]["clear_history_but_keep_depth"] = {
 class LiteLLMChatModelWithHistory(LiteLLMChatModelBase, ChatHistoryHandler):
 
     def __init__(self, **kwargs):
+        # ChatHistoryHandler.__init__ is reached through the MRO and sets up
+        # the history settings and the hourly cleanup timer
         super().__init__(info, **kwargs)
-        self.history_max_turns = self.get_config("history_max_turns", 10)
-        self.history_max_time = self.get_config("history_max_time", 3600)
-        self.history_key = f"{self.flow_name}_{self.name}_history"
-
-        # Set up hourly timer for history cleanup
-        self.add_timer(3600000, "history_cleanup", interval_ms=3600000)
 
     def invoke(self, message, data):
         session_id = data.get("session_id")
@@ -59,36 +55,25 @@ class LiteLLMChatModelWithHistory(LiteLLMChatModelBase, ChatHistoryHandler):
         messages = data.get("messages", [])
         stream = data.get("stream")
 
-        with self.get_lock(self.history_key):
-            history = self.kv_store_get(self.history_key) or {}
-            if session_id not in history:
-                history[session_id] = {"messages": [], "last_accessed": time.time()}
+        with self.get_session_lock(session_id):
+            # One timestamp for everything this turn records
+            now = time.time()
+            # The history helpers work on a mapping of session id to history
+            history = {session_id: self.load_session_history(session_id, now)}
 
             if clear_history_but_keep_depth is not None:
                 self.clear_history_but_keep_depth(
-                    session_id, clear_history_but_keep_depth, history
+                    session_id, clear_history_but_keep_depth, history, now
                 )
 
             session_history = history[session_id]["messages"]
-            log.debug(f"Session history: {session_history}")
-
-            # If the passed in messages have a system message and the history's
-            # first message is a system message, then replace the history's first
-            # message with the passed in messages' system message
-            if (
-                len(messages)
-                and messages[0]["role"] == "system"
-                and len(session_history)
-                and session_history[0]["role"] == "system"
-            ):
-                session_history[0] = messages[0]
-                session_history.extend(messages[1:])
-            else:
-                session_history.extend(messages)
-
-            history[session_id]["last_accessed"] = time.time()
-
-            self.prune_history(session_id, history)
+            log.debug("Session history: %s", session_history)
+
+            self.add_messages_to_history(session_history, messages)
+
+            history[session_id]["last_accessed"] = now
+
+            self.prune_history(session_id, history, now)
 
             response = super().invoke(
                 message, {"messages": history[session_id]["messages"], "stream": stream}
@@ -102,7 +87,7 @@ class LiteLLMChatModelWithHistory(LiteLLMChatModelBase, ChatHistoryHandler):
                 }
             )
 
-            self.kv_store_set(self.history_key, history)
-            log.debug(f"Updated history: {history}")
+            self.store_session_history(session_id, history[session_id])
+            log.debug("Updated history: %s", history)
 
         return response
@@ -1,5 +1,8 @@
 """LiteLLM embedding component"""
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 from .litellm_base import LiteLLMBase, litellm_info_base
 from .....common.log import log
 
@@ -8,6 +11,33 @@ info.update(
     {
         "class_name": "LiteLLMEmbeddings",
         "description": "Embed text using a LiteLLM model",
+        "config_parameters": litellm_info_base["config_parameters"]
+        + [
+            {
+                "name": "embedding_cache_size",
+                "required": False,
+                "description": (
+                    "Number of embeddings of recently seen text to keep and reuse "
+                    "instead of calling the model again. Set to 0 to disable"
+                ),
+                "default": 1000,
+            },
+            {
+                "name": "embedding_batch_size",
+                "required": False,
+                "description": (
+                    "Maximum number of items sent to the model in one request. "
+                    "Larger inputs are split into batches"
+                ),
+                "default": 96,
+            },
+            {
+                "name": "embedding_max_concurrency",
+                "required": False,
+                "description": "Maximum number of batches sent to the model at once",
+                "default": 4,
+            },
+        ],
         "input_schema": {
             "type": "object",
             "properties": {
@@ -35,20 +65,92 @@ info.update(
     }
 )
 
+
 class LiteLLMEmbeddings(LiteLLMBase):
     def __init__(self, **kwargs):
         super().__init__(info, **kwargs)
+        self.embedding_cache_size = self.get_config("embedding_cache_size", 1000)
+        self.embedding_batch_size = max(1, self.get_config("embedding_batch_size", 96))
+        self.embedding_max_concurrency = max(
+            1, self.get_config("embedding_max_concurrency", 4)
+        )
+        # Text to embedding, least recently used first. The model is fixed for
+        # the component, so the text alone is the key. Embeddings are stored as
+        # tuples, so a caller changing its result can't change the cache
+        self.embedding_cache = OrderedDict()
 
     def invoke(self, message, data):
         """invoke the embedding model"""
         items = data.get("items", [])
+        if not isinstance(items, list):
+            items = [items]
+
+        # Only the items that were not seen recently are sent to the model
+        embeddings = [None] * len(items)
+        uncached_indexes = []
+        for index, item in enumerate(items):
+            embedding = self.get_cached_embedding(item)
+            if embedding is None:
+                uncached_indexes.append(index)
+            else:
+                embeddings[index] = embedding
 
-        response = self.router.embedding(model=self.load_balancer[0]["model_name"], 
-                input=items)
+        if uncached_indexes:
+            new_embeddings = self.embed([items[index] for index in uncached_indexes])
+            for index, embedding in zip(uncached_indexes, new_embeddings):
+                embeddings[index] = embedding
+                self.cache_embedding(items[index], embedding)
+
+        log.debug(
+            "Embedded %d items, %d from the cache",
+            len(items),
+            len(items) - len(uncached_indexes),
+        )
+        return {"embeddings": embeddings}
+
+    def embed(self, items):
+        """Embed the items, splitting them into batches sent concurrently"""
+        batch_size = self.embedding_batch_size
+        batches = [
+            items[start : start + batch_size]
+            for start in range(0, len(items), batch_size)
+        ]
+        if len(batches) == 1:
+            return self.embed_batch(batches[0])
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.embedding_max_concurrency, len(batches))
+        ) as executor:
+            results = executor.map(self.embed_batch, batches)
+            return [embedding for batch in results for embedding in batch]
+
+    def embed_batch(self, batch):
+        response = self.router.embedding(
+            model=self.load_balancer[0]["model_name"], input=batch
+        )
 
         # Extract the embedding data from the response
-        embeddings = []
-        for embedding in response.get("data", []):
-            embeddings.append(embedding['embedding'])
+        embeddings = [embedding["embedding"] for embedding in response.get("data", [])]
+        if len(embeddings) != len(batch):
+            raise ValueError(
+                f"Embedding model returned {len(embeddings)} embeddings "
+                f"for {len(batch)} items"
+            )
+        return embeddings
+
+    def get_cached_embedding(self, item):
+        if not isinstance(item, str):
+            return None
+        embedding = self.embedding_cache.get(item)
+        if embedding is None:
+            return None
+        self.embedding_cache.move_to_end(item)
+        return list(embedding)
 
-        return {"embeddings": embeddings}
\ No newline at end of file
+    def cache_embedding(self, item, embedding):
+        if not isinstance(item, str) or self.embedding_cache_size <= 0:
+            return
+        self.embedding_cache[item] = tuple(embedding)
+        self.embedding_cache.move_to_end(item)
+        if len(self.embedding_cache) > self.embedding_cache_size:
+            self.embedding_cache.popitem(last=False)
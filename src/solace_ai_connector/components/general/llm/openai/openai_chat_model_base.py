@@ -142,6 +142,10 @@ class OpenAIChatModelBase(ComponentBase):
 
     def __init__(self, module_info, **kwargs):
         super().__init__(module_info, **kwargs)
+        # The client has its own HTTP connection pool and loads the certifi
+        # bundle when it is created, so it is kept between invokes
+        self.client = None
+        self.client_settings = None
         self.init()
 
     def init(self):
@@ -163,9 +167,7 @@ class OpenAIChatModelBase(ComponentBase):
         messages = data.get("messages", [])
         stream = data.get("stream", self.llm_mode == "stream")
 
-        client = OpenAI(
-            api_key=self.get_config("api_key"), base_url=self.get_config("base_url")
-        )
+        client = self.get_client()
 
         if stream:
             return self.invoke_stream(client, message, messages)
@@ -187,6 +189,25 @@ class OpenAIChatModelBase(ComponentBase):
                     else:
                         time.sleep(1)
 
+    def get_client(self):
+        # The settings can come from the message, so rebuild the client if they
+        # have changed since the last invoke
+        settings = (self.get_config("api_key"), self.get_config("base_url"))
+        if self.client is None or settings != self.client_settings:
+            self.close_client()
+            self.client = OpenAI(api_key=settings[0], base_url=settings[1])
+            self.client_settings = settings
+        return self.client
+
+    def close_client(self):
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+            self.client_settings = None
+
+    def stop_component(self):
+        self.close_client()
+
     def invoke_stream(self, client, message, messages):
         response_uuid = str(uuid.uuid4())
         if self.set_response_uuid_in_user_properties:
@@ -238,7 +238,7 @@ class BrokerRequestResponse(BrokerBase):
         )
 
     def setup_test_pass_through(self):
-        self.pass_through_queue = queue.Queue()
+        self.pass_through_queue = queue.SimpleQueue()
 
     def start_response_thread(self):
         if self.test_mode:
@@ -264,6 +264,9 @@ class BrokerRequestResponse(BrokerBase):
         while not self.stop_signal.is_set():
             try:
                 message = self.pass_through_queue.get(timeout=1)
+                if message is None:
+                    # Woken up by stop_component
+                    continue
                 decoded_payload = self.decode_payload(message.get_payload())
                 message.set_payload(decoded_payload)
                 self.process_response(message)
@@ -461,6 +464,12 @@ class BrokerRequestResponse(BrokerBase):
 
         return None  # The actual result will be processed in handle_responses
 
+    def stop_component(self):
+        if self.test_mode:
+            # Wake the pass-through thread so it doesn't wait out its poll
+            self.pass_through_queue.put(None)
+        super().stop_component()
+
     def cleanup(self):
         if self.response_thread:
             self.response_thread.join()
@@ -59,9 +59,10 @@ class TimerInput(ComponentBase):
                 self.last_message_time += self.interval_ms / 1000
             return Message(payload={})
         else:
-            # Sleep for the remaining time
+            # Sleep for the remaining time, waking up early if the connector stops
             sleep_time = (self.interval_ms - delta_time) / 1000
-            time.sleep(sleep_time)
+            if self.stop_signal.wait(sleep_time):
+                return None
             self.last_message_time = self.get_current_time()
 
         return Message(payload={})
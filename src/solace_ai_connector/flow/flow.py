@@ -1,6 +1,7 @@
 """Main class for the flow"""
 
 import threading
+import time
 from typing import List
 
 from ..components.component_base import ComponentBase
@@ -15,6 +16,11 @@ class FlowLockManager:
         self.locks = {}
 
     def get_lock(self, lock_name):
+        # Locks are never removed, so an existing one can be returned without
+        # serializing every caller on the manager's own lock
+        lock = self.locks.get(lock_name)
+        if lock is not None:
+            return lock
         with self._lock:
             if lock_name not in self.locks:
                 self.locks[lock_name] = threading.Lock()
@@ -33,6 +39,9 @@ class FlowKVStore:
     def get(self, key):
         return self.store.get(key, None)
 
+    def delete(self, key):
+        self.store.pop(key, None)
+
 
 class Flow:
 
@@ -150,9 +159,23 @@ class Flow:
         for comp in self.component_groups[-1]:
             comp.set_next_component(component)
 
-    def wait_for_threads(self):
+    def wake_components(self):
+        """Wake the component threads so they stop without waiting for a poll"""
+        for component_group in self.component_groups:
+            for component in component_group:
+                component.wake_up()
+
+    def wait_for_threads(self, timeout=None):
+        """Join the component threads, waiting at most timeout seconds in total"""
+        if timeout is None:
+            for thread in self.threads:
+                thread.join()
+            return
+        # The threads were all told to stop at once, so they share one deadline
+        # rather than each getting the full timeout
+        deadline = time.monotonic() + timeout
         for thread in self.threads:
-            thread.join()
+            thread.join(max(0, deadline - time.monotonic()))
 
     def cleanup(self):
         """Clean up resources and ensure all threads are properly joined"""
@@ -67,14 +67,16 @@ class RequestResponseFlowController:
                 }
             ],
         }
-        return self.connector.create_flow(flow=config, index=0, flow_instance_index=0)
+        return self.connector.create_internal_flow(
+            flow=config, index=0, flow_instance_index=0
+        )
 
     def setup_queues(self, flow):
         # Input queue to send the message to the flow
         self.input_queue = flow.get_input_queue()
 
         # Response queue to receive the response from the flow
-        self.response_queue = queue.Queue()
+        self.response_queue = queue.SimpleQueue()
         rrcComponent = RequestResponseControllerOuputComponent(self)
         flow.set_next_component(rrcComponent)
 
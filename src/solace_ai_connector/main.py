@@ -52,17 +52,19 @@ def process_includes(file_path, base_dir):
     return include_pattern.sub(include_repl, content)
 
 
+ENV_VAR_PATTERN = re.compile(r"\$\{([^}:\s]+)(?:\s*,\s*([^}]*))?\}")
+
+
 def expandvars_with_defaults(text):
     """Expand environment variables with support for default values.
     Supported syntax: ${VAR_NAME} or ${VAR_NAME, default_value}"""
-    pattern = re.compile(r"\$\{([^}:\s]+)(?:\s*,\s*([^}]*))?\}")
 
     def replacer(match):
         var_name = match.group(1)
         default_value = match.group(2) if match.group(2) is not None else ""
         return os.environ.get(var_name, default_value)
 
-    return pattern.sub(replacer, text)
+    return ENV_VAR_PATTERN.sub(replacer, text)
 
 
 def merge_config(dict1, dict2):
@@ -1,11 +1,10 @@
+import importlib.util
 import time
 import pickle
 import threading
 from abc import ABC, abstractmethod
 from typing import Any, Optional, Dict, Tuple
 from threading import Lock
-from sqlalchemy import create_engine, Column, String, Float, LargeBinary
-from sqlalchemy.orm import declarative_base, sessionmaker
 from ..common.event import Event, EventType
 from ..common.log import log
 
@@ -23,6 +22,8 @@ class CacheStorageBackend(ABC):
         expiry: Optional[float] = None,
         metadata: Optional[Dict] = None,
     ):
+        """Store a value. An unexpired entry already stored under the key keeps
+        its expiry, metadata and component where this call does not give them"""
         pass
 
     @abstractmethod
@@ -58,6 +59,13 @@ class InMemoryStorage(CacheStorageBackend):
         component=None,
     ):
         with self.lock:
+            existing = self.store.get(key)
+            if existing and not (
+                existing["expiry"] and time.time() > existing["expiry"]
+            ):
+                expiry = expiry or existing["expiry"]
+                metadata = metadata or existing["metadata"]
+                component = component or existing["component"]
             self.store[key] = {
                 "value": value,
                 "expiry": expiry,
@@ -83,29 +91,46 @@ class InMemoryStorage(CacheStorageBackend):
             }
 
 
-Base = declarative_base()
+_cache_item_model = None
 
 
-class CacheItem(Base):
-    __tablename__ = "cache_items"
+def get_cache_item_model():
+    """Define the SQLAlchemy model on first use. sqlalchemy is slow to import
+    and only the sqlalchemy backend needs it"""
+    global _cache_item_model  # pylint: disable=global-statement
+    if _cache_item_model is None:
+        from sqlalchemy import Column, String, Float, LargeBinary
+        from sqlalchemy.orm import declarative_base
 
-    key = Column(String, primary_key=True)
-    value = Column(LargeBinary)
-    expiry = Column(Float, nullable=True)
-    item_metadata = Column(LargeBinary, nullable=True)
-    component_reference = Column(String, nullable=True)
+        Base = declarative_base()
+
+        class CacheItem(Base):
+            __tablename__ = "cache_items"
+
+            key = Column(String, primary_key=True)
+            value = Column(LargeBinary)
+            expiry = Column(Float, nullable=True)
+            item_metadata = Column(LargeBinary, nullable=True)
+            component_reference = Column(String, nullable=True)
+
+        _cache_item_model = CacheItem
+    return _cache_item_model
 
 
 class SQLAlchemyStorage(CacheStorageBackend):
     def __init__(self, connection_string: str):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+
+        self.CacheItem = get_cache_item_model()
         self.engine = create_engine(connection_string)
-        Base.metadata.create_all(self.engine)
+        self.CacheItem.metadata.create_all(self.engine)
         self.Session = sessionmaker(bind=self.engine)
 
     def get(self, key: str, include_meta=False) -> Any:
         session = self.Session()
         try:
-            item = session.query(CacheItem).filter_by(key=key).first()
+            item = session.query(self.CacheItem).filter_by(key=key).first()
             if item is None:
                 return None
             if item.expiry and time.time() > item.expiry:
@@ -135,16 +160,22 @@ class SQLAlchemyStorage(CacheStorageBackend):
     ):
         session = self.Session()
         try:
-            item = session.query(CacheItem).filter_by(key=key).first()
+            item = session.query(self.CacheItem).filter_by(key=key).first()
+            keep_existing = item is not None and not (
+                item.expiry and time.time() > item.expiry
+            )
             if item is None:
-                item = CacheItem(key=key)
+                item = self.CacheItem(key=key)
                 session.add(item)
             item.value = pickle.dumps(value)
-            item.expiry = time.time() + expiry if expiry else None
-            item.item_metadata = pickle.dumps(metadata) if metadata else None
-            item.component_reference = (
-                self._get_component_reference(component) if component else None
-            )
+            if expiry or not keep_existing:
+                item.expiry = time.time() + expiry if expiry else None
+            if metadata or not keep_existing:
+                item.item_metadata = pickle.dumps(metadata) if metadata else None
+            if component or not keep_existing:
+                item.component_reference = (
+                    self._get_component_reference(component) if component else None
+                )
             session.commit()
         finally:
             session.close()
@@ -152,7 +183,7 @@ class SQLAlchemyStorage(CacheStorageBackend):
     def delete(self, key: str):
         session = self.Session()
         try:
-            item = session.query(CacheItem).filter_by(key=key).first()
+            item = session.query(self.CacheItem).filter_by(key=key).first()
             if item:
                 session.delete(item)
                 session.commit()
@@ -162,7 +193,7 @@ class SQLAlchemyStorage(CacheStorageBackend):
     def get_all(self) -> Dict[str, Tuple[Any, Optional[Dict], Optional[float], Any]]:
         session = self.Session()
         try:
-            items = session.query(CacheItem).all()
+            items = session.query(self.CacheItem).all()
             return {
                 item.key: (
                     pickle.loads(item.value),
@@ -216,13 +247,8 @@ class CacheService:
         # Calculate the expiry time
         expiry = time.time() + expiry if expiry else None
 
-        # Check if the key already exists
-        cache = self.storage.get(key, include_meta=True)
-        if cache:
-            # Use the cache data to combine with the new data
-            expiry = expiry or cache["expiry"]
-            metadata = metadata or cache["metadata"]
-            component = component or cache["component"]
+        # The backend combines this with an existing entry for the key, which
+        # saves reading it back first - a round trip for a database backend
         self.storage.set(key, value, expiry, metadata, component)
         with self.lock:
             if expiry:
@@ -292,6 +318,10 @@ def create_storage_backend(backend_type: str = None, **kwargs) -> CacheStorageBa
         connection_string = kwargs.get("connection_string")
         if not connection_string:
             raise ValueError("SQLAlchemy backend requires a connection_string")
+        if importlib.util.find_spec("sqlalchemy") is None:
+            raise ValueError(
+                "SQLAlchemy backend requires the sqlalchemy package to be installed"
+            )
         return SQLAlchemyStorage(connection_string)
     # Add more backend types here as needed
     raise ValueError(f"Unsupported storage backend: {backend_type}")
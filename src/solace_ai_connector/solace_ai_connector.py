@@ -13,18 +13,61 @@ from .common.event import Event, EventType
 from .services.cache_service import CacheService, create_storage_backend
 
 
+def validate_config(config):
+    """Just some quick validation of the config for now. This only looks at the
+    config itself, so it can be checked without building a connector"""
+    if not config:
+        raise ValueError("No config provided")
+
+    if not config.get("flows"):
+        raise ValueError("No flows defined in configuration file")
+
+    if not config.get("log"):
+        log.warning("No log config provided - using defaults")
+
+    # Loop through the flows and validate them
+    for index, flow in enumerate(config.get("flows", [])):
+        if not flow.get("name"):
+            raise ValueError(f"Flow name not provided in flow {index}")
+
+        if not flow.get("components"):
+            raise ValueError(f"Flow components list not provided in flow {index}")
+
+        # Verify that the components list is a list
+        if not isinstance(flow.get("components"), list):
+            raise ValueError(f"Flow components is not a list in flow {index}")
+
+        # Loop through the components and validate them
+        for component_index, component in enumerate(flow.get("components", [])):
+            if not component.get("component_name"):
+                raise ValueError(
+                    f"component_name not provided in flow {index}, component {component_index}"
+                )
+
+            if not component.get("component_module"):
+                raise ValueError(
+                    f"component_module not provided in flow {index}, "
+                    f"component {component_index}"
+                )
+
+
 class SolaceAiConnector:
     """Solace AI Connector"""
 
     def __init__(self, config, event_handlers=None, error_queue=None):
         self.config = config or {}
         self.flows: List[Flow] = []
+        # Flows that components create for themselves, e.g. for broker
+        # request/response. They aren't configured flows, but stop with them
+        self.internal_flows: List[Flow] = []
         self.trace_queue = None
         self.trace_thread = None
         self.flow_input_queues = {}
+        # The first instance of each flow, for get_flow
+        self.flows_by_name = {}
         self.stop_signal = threading.Event()
         self.event_handlers = event_handlers or {}
-        self.error_queue = error_queue if error_queue else queue.Queue()
+        self.error_queue = error_queue if error_queue else queue.SimpleQueue()
         self.setup_logging()
         self.setup_trace()
         resolve_config_values(self.config)
@@ -62,6 +105,7 @@ class SolaceAiConnector:
                 flow_instance = self.create_flow(flow, index, i)
                 flow_input_queue = flow_instance.get_flow_input_queue()
                 self.flow_input_queues[flow.get("name")] = flow_input_queue
+                self.flows_by_name.setdefault(flow.get("name"), flow_instance)
                 self.flows.append(flow_instance)
         for flow in self.flows:
             flow.run()
@@ -80,6 +124,13 @@ class SolaceAiConnector:
             connector=self,
         )
 
+    def create_internal_flow(self, flow: dict, index: int, flow_instance_index: int):
+        """Create a flow for a component's own use and track it so that it is
+        stopped and cleaned up with the connector"""
+        flow_instance = self.create_flow(flow, index, flow_instance_index)
+        self.internal_flows.append(flow_instance)
+        return flow_instance
+
     def send_message_to_flow(self, flow_name, message):
         """Send a message to a flow"""
         flow_input_queue = self.flow_input_queues.get(flow_name)
@@ -93,7 +144,7 @@ class SolaceAiConnector:
         """Wait for the flows to finish"""
         while not self.stop_signal.is_set():
             try:
-                for flow in self.flows:
+                for flow in self.get_all_flows():
                     flow.wait_for_threads()
                 break
             except KeyboardInterrupt:
@@ -104,9 +155,11 @@ class SolaceAiConnector:
     def cleanup(self):
         """Clean up resources and ensure all threads are properly joined"""
         log.info("Cleaning up Solace AI Event Connector")
-        for flow in self.flows:
+        for flow in self.get_all_flows():
             flow.cleanup()
         self.flows.clear()
+        self.flows_by_name.clear()
+        self.internal_flows.clear()
         if hasattr(self, "trace_queue") and self.trace_queue:
             self.trace_queue.put(None)  # Signal the trace thread to stop
         if self.trace_thread:
@@ -131,7 +184,7 @@ class SolaceAiConnector:
         if trace_file:
             log.info("Setting up trace to file %s", trace_file)
             # Create a trace queue
-            self.trace_queue = queue.Queue()
+            self.trace_queue = queue.SimpleQueue()
             # Start a new thread to handle trace messages
             self.trace_thread = threading.Thread(
                 target=self.handle_trace, args=(trace_file,)
@@ -143,66 +196,45 @@ class SolaceAiConnector:
 
         # Create the trace file
         with open(trace_file, "a", encoding="utf-8") as f:
-            while True:
-                # Get the next trace message
-                try:
-                    trace_message = self.trace_queue.get(timeout=1)
-                    # Write the trace message to the file with a timestamp
-                    timestamp = datetime.now().isoformat()
-                    f.write(f"{timestamp}: {trace_message}\n")
-                    f.flush()
+            stopping = False
+            while not stopping:
+                # Block until the next trace message, then take whatever else
+                # is already queued so that a burst is written and flushed once.
+                # None is the stop sentinel
+                trace_messages = [self.trace_queue.get()]
+                while True:
+                    try:
+                        trace_messages.append(self.trace_queue.get_nowait())
+                    except queue.Empty:
+                        break
 
-                except queue.Empty:
-                    if self.stop_signal.is_set():
+                # Write the trace messages to the file with a timestamp
+                lines = []
+                for trace_message in trace_messages:
+                    if trace_message is None:
+                        stopping = True
                         break
-                    continue
+                    timestamp = datetime.now().isoformat()
+                    lines.append(f"{timestamp}: {trace_message}\n")
+                if lines:
+                    f.write("".join(lines))
+                    f.flush()
 
     def validate_config(self):
         """Just some quick validation of the config for now"""
-        if not self.config:
-            raise ValueError("No config provided")
-
-        if not self.config.get("flows"):
-            raise ValueError("No flows defined in configuration file")
-
-        if not self.config.get("log"):
-            log.warning("No log config provided - using defaults")
-
-        # Loop through the flows and validate them
-        for index, flow in enumerate(self.config.get("flows", [])):
-            if not flow.get("name"):
-                raise ValueError(f"Flow name not provided in flow {index}")
-
-            if not flow.get("components"):
-                raise ValueError(f"Flow components list not provided in flow {index}")
-
-            # Verify that the components list is a list
-            if not isinstance(flow.get("components"), list):
-                raise ValueError(f"Flow components is not a list in flow {index}")
-
-            # Loop through the components and validate them
-            for component_index, component in enumerate(flow.get("components", [])):
-                if not component.get("component_name"):
-                    raise ValueError(
-                        f"component_name not provided in flow {index}, component {component_index}"
-                    )
-
-                if not component.get("component_module"):
-                    raise ValueError(
-                        f"component_module not provided in flow {index}, "
-                        f"component {component_index}"
-                    )
+        validate_config(self.config)
 
     def get_flows(self):
         """Return the flows"""
         return self.flows
 
+    def get_all_flows(self):
+        """Return the configured flows and the internal flows"""
+        return self.flows + self.internal_flows
+
     def get_flow(self, flow_name):
         """Return a specific flow by name"""
-        for flow in self.flows:
-            if flow.name == flow_name:
-                return flow
-        return None
+        return self.flows_by_name.get(flow_name)
 
     def setup_cache_service(self):
         """Setup the cache service"""
@@ -215,7 +247,10 @@ class SolaceAiConnector:
         """Stop the Solace AI Event Connector"""
         log.info("Stopping Solace AI Event Connector")
         self.stop_signal.set()
+        for flow in self.get_all_flows():
+            flow.wake_components()
         self.timer_manager.stop()  # Stop the timer manager first
         self.cache_service.stop()  # Stop the cache service
         if self.trace_thread:
+            self.trace_queue.put(None)  # Signal the trace thread to stop
             self.trace_thread.join()
@@ -1,9 +1,10 @@
+import copy
 import os
 import queue
-import sys
-import yaml
+import time
+from functools import lru_cache
 
-sys.path.insert(0, os.path.abspath("src"))
+import yaml
 
 from solace_ai_connector.solace_ai_connector import SolaceAiConnector
 from solace_ai_connector.common.log import log
@@ -12,6 +13,9 @@ from solace_ai_connector.common.message import Message
 
 # from solace_ai_connector.common.message import Message
 
+# Use libyaml's parser when PyYAML was built with it - it is much faster
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class TestOutputComponent:
     """A simple output component that receives the output from the previous component.
@@ -60,12 +64,34 @@ class TestInputComponent:
         self.next_component_queue.put(event)
 
 
+@lru_cache(maxsize=None)
+def parse_yaml_config(config_yaml):
+    """Parse a yaml config string. Tests build many connectors from the same
+    config strings, and PyYAML's parser is slow"""
+    return yaml.load(config_yaml, Loader=YAML_LOADER)
+
+
 def create_connector(config_or_yaml, event_handlers=None, error_queue=None):
     """Create a connector from a config that can be an object or a yaml string"""
 
     config = config_or_yaml
     if isinstance(config_or_yaml, str):
-        config = yaml.safe_load(config_or_yaml)
+        # The connector resolves the config in place, so give it its own copy
+        config = copy.deepcopy(parse_yaml_config(config_or_yaml))
+
+    if os.environ.get("SAC_TEST_QUIET") == "1":
+        # Don't have every test connector write its log and trace to disk. A bare
+        # "log:" or "trace:" section is loaded as None, hence the "or {}"
+        config = {
+            **config,
+            "log": {
+                **(config.get("log") or {}),
+                "log_file": os.devnull,
+                "log_file_level": "CRITICAL",
+            },
+        }
+        if (config.get("trace") or {}).get("trace_file"):
+            config["trace"] = {**config["trace"], "trace_file": os.devnull}
 
     # Create the connector
     connector = SolaceAiConnector(
@@ -222,7 +248,19 @@ def get_event_from_flow(flow_info):
 
 def dispose_connector(connector):
     stop_test_flows(connector)
+    # Safe to call again if the connector was already stopped
     connector.stop()
+    # stop() wakes every component thread, including those of the internal
+    # flows, so they should all exit right away. Fail rather than leak any
+    leaked_threads = []
+    deadline = time.monotonic() + 5
+    for flow in connector.get_all_flows():
+        flow.wait_for_threads(timeout=max(0, deadline - time.monotonic()))
+        leaked_threads.extend(
+            thread.name for thread in flow.threads if thread.is_alive()
+        )
+    if leaked_threads:
+        raise RuntimeError(f"Flow threads did not stop: {leaked_threads}")
 
 
 def create_and_run_component(
@@ -0,0 +1,51 @@
+"""Test setup shared by the test modules, mostly fixtures for the LiteLLM tests"""
+
+import os
+from unittest.mock import MagicMock
+
+import litellm
+import pytest
+
+# Load litellm through the component module once, at collection time, so every
+# test module that imports a LiteLLM component finds it in sys.modules
+import solace_ai_connector.components.general.llm.litellm.litellm_chat_model_base  # pylint: disable=unused-import
+
+# Have create_connector send the connector logs to os.devnull. Set
+# SAC_TEST_QUIET=0 to get solace_ai_connector.log back when debugging a test
+os.environ.setdefault("SAC_TEST_QUIET", "1")
+
+
+@pytest.fixture(scope="module")
+def valid_load_balancer_config():
+    """Shared by every test in a module - none of them mutate it"""
+    return [
+        {
+            "model_name": "gpt-4o",
+            "litellm_params": {"model": "openai/gpt-4o", "api_key": "test"},
+        }
+    ]
+
+
+@pytest.fixture
+def mock_message():
+    """A new mock for each test, so that no call history carries over"""
+    return MagicMock()
+
+
+@pytest.fixture(scope="session")
+def router_spec():
+    """The attribute names of litellm.Router, introspected once per session"""
+    return dir(litellm.Router)
+
+
+@pytest.fixture
+def router_mock(router_spec):
+    return MagicMock(spec=router_spec)
+
+
+@pytest.fixture
+def router_class(monkeypatch, router_mock):
+    """Replace litellm.Router so that components get router_mock"""
+    router_class = MagicMock(return_value=router_mock)
+    monkeypatch.setattr(litellm, "Router", router_class)
+    return router_class
@@ -1,18 +1,15 @@
 """This file tests acks in a flow"""
 
-import sys
-
-sys.path.append("src")
 import queue
 
-from solace_ai_connector.test_utils.utils_for_test_files import (  # pylint: disable=wrong-import-position
+from solace_ai_connector.test_utils.utils_for_test_files import (
     # create_connector,
     # create_and_run_component,
     dispose_connector,
     create_test_flows,
     send_message_to_flow,
 )
-from solace_ai_connector.common.message import (  # pylint: disable=wrong-import-position
+from solace_ai_connector.common.message import (
     Message,
 )
 
@@ -36,7 +33,7 @@ flows:
         component_module: give_ack_output
 """
     # Setup the error queue
-    error_queue = queue.Queue()
+    error_queue = queue.SimpleQueue()
 
     connector, flows = create_test_flows(config_yaml, error_queue=error_queue)
     flow = flows[0]
@@ -45,7 +42,7 @@ flows:
     send_message_to_flow(flow, message)
 
     try:
-        error_event = error_queue.get(timeout=5)
+        error_event = error_queue.get(timeout=1)
         error_message = error_event.data
         payload = error_message.get_data("input.payload")
         assert payload["location"] == {
@@ -1,10 +1,9 @@
 """Some tests to verify the aggregate component works as expected"""
 
-import sys
-
-sys.path.append("src")
 import time
 
+import pytest
+
 from solace_ai_connector.test_utils.utils_for_test_files import (
     create_test_flows,
     dispose_connector,
@@ -16,9 +15,8 @@ from solace_ai_connector.common.message import Message
 from solace_ai_connector.common.event import EventType
 
 
-def test_aggregate_by_time():
-    """Test the aggregate component by time"""
-    TIMEOUT_MS = 700
+def create_aggregate_flow(max_items, max_time_ms):
+    """Create a connector with a single aggregate component on the input payload"""
     config_yaml = f"""
 log:
   log_file_level: DEBUG
@@ -29,13 +27,19 @@ flows:
       - component_name: aggregate
         component_module: aggregate
         component_config:
-          max_items: 10
-          max_time_ms: {TIMEOUT_MS}
+          max_items: {max_items}
+          max_time_ms: {max_time_ms}
         input_selection:
           source_expression: input.payload
 """
     connector, flows = create_test_flows(config_yaml)
-    flow = flows[0]
+    return connector, flows[0]
+
+
+def test_aggregate_by_time():
+    """Test the aggregate component by time"""
+    TIMEOUT_MS = 200
+    connector, flow = create_aggregate_flow(10, TIMEOUT_MS)
 
     try:
         for i in range(2):
@@ -50,16 +54,14 @@ flows:
 
             end_time = time.time()
 
-            # Check that the time it took is within a reasonable range
-            assert abs((end_time - start_time) - (TIMEOUT_MS / 1000)) < 0.05
-
-            # Expected value
-            expected = []
-            for j in range(3):
-                expected.append({"text": f"Hello, World! {i} {j}"})
+            # Check that the batch came out on the timer. The bounds are relative
+            # to the timeout so that a busy machine doesn't fail the test
+            elapsed_ms = (end_time - start_time) * 1000
+            assert TIMEOUT_MS / 2 < elapsed_ms < TIMEOUT_MS * 2
 
             # Check the output
             assert event.event_type == EventType.MESSAGE
+            expected = [{"text": f"Hello, World! {i} {j}"} for j in range(3)]
             assert event.data.get_data("previous") == expected
 
     finally:
@@ -67,101 +69,70 @@ flows:
         dispose_connector(connector)
 
 
-def test_aggregate_by_items():
-    """Test the aggregate component by items"""
-    config_yaml = """
-log:
-  log_file_level: DEBUG
-  log_file: solace_ai_connector.log
-flows:
-  - name: test_flow
-    components:
-      - component_name: aggregate
-        component_module: aggregate
-        component_config:
-          max_items: 3
-          max_time_ms: 1000
-        input_selection:
-          source_expression: input.payload
-"""
-    connector, flows = create_test_flows(config_yaml)
-    flow = flows[0]
+# The max_time_ms of the flow shared by the tests below
+MAX_TIME_MS = 400
 
+
+@pytest.fixture(scope="module")
+def items_and_time_flow():
+    """An aggregate flow of at most 3 items or MAX_TIME_MS, shared by the tests
+    below. Each of them reads back every batch, so none is left for the next"""
+    connector, flow = create_aggregate_flow(3, MAX_TIME_MS)
     try:
-        for i in range(2):
-            start_time = time.time()
-            for j in range(3):
-                message = Message(payload={"text": f"Hello, World! {i} {j}"})
-                send_message_to_flow(flow, message)
+        yield flow
+    finally:
+        dispose_connector(connector)
 
-            # Get the output event
-            message = get_message_from_flow(flow)
 
-            end_time = time.time()
+def test_aggregate_by_items(items_and_time_flow):
+    """Test the aggregate component by items"""
+    flow = items_and_time_flow
 
-            # Check that the time it took is within a reasonable range
-            assert (end_time - start_time) < 0.05
+    for i in range(2):
+        start_time = time.time()
+        for j in range(3):
+            message = Message(payload={"text": f"Hello, World! {i} {j}"})
+            send_message_to_flow(flow, message)
 
-            # Expected value
-            expected = []
-            for j in range(3):
-                expected.append({"text": f"Hello, World! {i} {j}"})
+        # Get the output event
+        message = get_message_from_flow(flow)
 
-            # Check the output
-            assert message.get_data("previous") == expected
-    finally:
-        # Tear down the connector
-        dispose_connector(connector)
+        end_time = time.time()
+
+        # Check that the batch came out on the item count, well before the timer
+        assert (end_time - start_time) * 1000 < MAX_TIME_MS / 2
 
+        # Check the output
+        expected = [{"text": f"Hello, World! {i} {j}"} for j in range(3)]
+        assert message.get_data("previous") == expected
 
-def test_both_items_and_time():
+
+def test_both_items_and_time(items_and_time_flow):
     """Test the aggregate component by items"""
-    MAX_TIME_MS = 1000
-    config_yaml = f"""
-log:
-  log_file_level: DEBUG
-  log_file: solace_ai_connector.log
-flows:
-  - name: test_flow
-    components:
-      - component_name: aggregate
-        component_module: aggregate
-        component_config:
-          max_items: 3
-          max_time_ms: {MAX_TIME_MS}
-        input_selection:
-          source_expression: input.payload
-"""
-    connector, flows = create_test_flows(config_yaml)
-    flow = flows[0]
+    flow = items_and_time_flow
 
     # We will send 10 messages. We should get 4 messages out, 3 due to max_items
     # and 1 due to max_time_ms
 
+    # Built apart from the sent payloads, so that the flow changing one shows up
+    expected = [{"text": f"Hello, World! {j}"} for j in range(10)]
     start_time = time.time()
-    expected = []
-    try:
-        for j in range(10):
-            message = Message(payload={"text": f"Hello, World! {j}"})
-            expected.append({"text": f"Hello, World! {j}"})
-            send_message_to_flow(flow, message)
+    for j in range(10):
+        send_message_to_flow(flow, Message(payload={"text": f"Hello, World! {j}"}))
 
-        for j in range(4):
-            if j < 3:
-                # Get the next 3 expected messages
-                event = get_event_from_flow(flow)
-                end_time = time.time()
-                assert event.event_type == EventType.MESSAGE
-                assert event.data.get_data("previous") == expected[j * 3 : j * 3 + 3]
-                # assert (end_time - start_time) < 0.1
-            else:
-                # Get the last expected message
-                event = get_event_from_flow(flow)
-                end_time = time.time()
-                assert abs((end_time - start_time) - (MAX_TIME_MS / 1000)) < 0.1
-                assert event.event_type == EventType.MESSAGE
-                assert event.data.get_data("previous") == expected[j * 3 :]
-
-    finally:
-        # Tear down the connector
-        dispose_connector(connector)
+    for j in range(4):
+        if j < 3:
+            # Get the next 3 expected messages
+            event = get_event_from_flow(flow)
+            end_time = time.time()
+            assert event.event_type == EventType.MESSAGE
+            assert event.data.get_data("previous") == expected[j * 3 : j * 3 + 3]
+            # assert (end_time - start_time) < 0.1
+        else:
+            # Get the last expected message
+            event = get_event_from_flow(flow)
+            end_time = time.time()
+            elapsed_ms = (end_time - start_time) * 1000
+            assert MAX_TIME_MS / 2 < elapsed_ms < MAX_TIME_MS * 2
+            assert event.event_type == EventType.MESSAGE
+            assert event.data.get_data("previous") == expected[j * 3 :]
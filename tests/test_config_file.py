@@ -1,12 +1,9 @@
 """Test various things related to the configuration file"""
 
-import sys
 import pytest
 import yaml
 
-sys.path.append("src")
-
-from solace_ai_connector.test_utils.utils_for_test_files import (  # pylint: disable=wrong-import-position
+from solace_ai_connector.test_utils.utils_for_test_files import (
     create_connector,
     create_test_flows,
     dispose_connector,
@@ -14,8 +11,9 @@ from solace_ai_connector.test_utils.utils_for_test_files import (  # pylint: dis
     get_message_from_flow,
 )
 
-from solace_ai_connector.solace_ai_connector import (  # pylint: disable=wrong-import-position
+from solace_ai_connector.solace_ai_connector import (
     SolaceAiConnector,
+    validate_config,
 )
 
 from solace_ai_connector.common.message import Message
@@ -24,33 +22,28 @@ import solace_ai_connector.components.general.pass_through
 # from solace_ai_connector.common.log import log
 
 
-def test_no_config_file():
+def test_no_config_file(tmp_path, monkeypatch):
     """Test that the program exits if no configuration file is provided"""
-    try:
+    # The connector sets up its default log file before it validates the config
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(ValueError) as e:
         SolaceAiConnector(None)
-    except ValueError as e:
-        assert str(e) == "No config provided"
+    assert str(e.value) == "No config provided"
 
 
-def test_no_flows():
-    """Test that the program exits if no flows are defined in the configuration file"""
-    try:
-        config_yaml = """
+# Each case is a configuration that fails flow validation and the error it raises
+INVALID_FLOW_CONFIGS = [
+    pytest.param(
+        """
 log:
   log_file_level: DEBUG
   log_file: solace_ai_connector.log
-"""
-        SolaceAiConnector(
-            yaml.safe_load(config_yaml),
-        )
-    except ValueError as e:
-        assert str(e) == "No flows defined in configuration file"
-
-
-def test_no_flow_name():
-    """Test that the program exits if no flow name is provided"""
-    try:
-        config_yaml = """
+""",
+        "No flows defined in configuration file",
+        id="no_flows",
+    ),
+    pytest.param(
+        """
 log:
   log_file_level: DEBUG
   log_file: solace_ai_connector.log
@@ -67,53 +60,35 @@ flows:
             dest_expression: user_data.path:my_path
         input_selection:
           source_expression: input.payload:text
-"""
-        SolaceAiConnector(
-            yaml.safe_load(config_yaml),
-        )
-    except ValueError as e:
-        assert str(e) == "Flow name not provided in flow 0"
-
-
-def test_no_flow_components():
-    """Test that the program exits if no flow components list is provided"""
-    try:
-        config_yaml = """
+""",
+        "Flow name not provided in flow 0",
+        id="no_flow_name",
+    ),
+    pytest.param(
+        """
 log:
   log_file_level: DEBUG
   log_file: solace_ai_connector.log
 flows:
   - name: test_flow
-"""
-        SolaceAiConnector(
-            yaml.safe_load(config_yaml),
-        )
-    except ValueError as e:
-        assert str(e) == "Flow components list not provided in flow 0"
-
-
-def test_flow_components_not_list():
-    """Test that the program exits if the flow components list is not a list"""
-    try:
-        config_yaml = """
+""",
+        "Flow components list not provided in flow 0",
+        id="no_flow_components",
+    ),
+    pytest.param(
+        """
 log:
   log_file_level: DEBUG
   log_file: solace_ai_connector.log
 flows:
   - name: test_flow
     components: not_a_list
-"""
-        SolaceAiConnector(
-            yaml.safe_load(config_yaml),
-        )
-    except ValueError as e:
-        assert str(e) == "Flow components is not a list in flow 0"
-
-
-def test_no_component_name():
-    """Test that the program exits if no component name is provided"""
-    try:
-        config_yaml = """
+""",
+        "Flow components is not a list in flow 0",
+        id="flow_components_not_list",
+    ),
+    pytest.param(
+        """
 log:
   log_file_level: DEBUG
   log_file: solace_ai_connector.log
@@ -123,18 +98,12 @@ flows:
       - component_module: delay
         input_selection:
           source_expression: input.payload:text
-"""
-        SolaceAiConnector(
-            yaml.safe_load(config_yaml),
-        )
-    except ValueError as e:
-        assert str(e) == "component_name not provided in flow 0, component 0"
-
-
-def test_no_component_module():
-    """Test that the program exits if no component module is provided"""
-    try:
-        config_yaml = """
+""",
+        "component_name not provided in flow 0, component 0",
+        id="no_component_name",
+    ),
+    pytest.param(
+        """
 log:
   log_file_level: DEBUG
   log_file: solace_ai_connector.log 
@@ -142,12 +111,36 @@ flows:
   - name: test_flow
     components:
       - component_name: delay1
+""",
+        "component_module not provided in flow 0, component 0",
+        id="no_component_module",
+    ),
+]
+
+
+@pytest.mark.parametrize("config_yaml,expected_error", INVALID_FLOW_CONFIGS)
+def test_invalid_flow_config(config_yaml, expected_error):
+    """Test that the program exits if the flows in the configuration file are invalid"""
+    # Validation only looks at the config, so there is no need to build a connector
+    with pytest.raises(ValueError) as e:
+        validate_config(yaml.safe_load(config_yaml))
+    assert str(e.value) == expected_error
+
+
+def test_connector_validates_config(tmp_path, monkeypatch):
+    """Test that building a connector validates its config"""
+    # The connector sets up its log file before it validates the config
+    monkeypatch.chdir(tmp_path)
+    config_yaml = """
+log:
+  log_file_level: DEBUG
+  log_file: solace_ai_connector.log
+flows:
+  - name: test_flow
 """
-        SolaceAiConnector(
-            yaml.safe_load(config_yaml),
-        )
-    except ValueError as e:
-        assert str(e) == "component_module not provided in flow 0, component 0"
+    with pytest.raises(ValueError) as e:
+        SolaceAiConnector(yaml.safe_load(config_yaml))
+    assert str(e.value) == "Flow components list not provided in flow 0"
 
 
 def test_static_import_and_object_config():
@@ -169,10 +162,8 @@ def test_static_import_and_object_config():
             }
         ],
     }
-    connector = None
+    connector, flows = create_test_flows(config)
     try:
-        connector, flows = create_test_flows(config)
-
         # Test pushing a simple message through the delay component
         message = Message(payload={"text": "Hello, World!"})
         send_message_to_flow(flows[0], message)
@@ -182,18 +173,13 @@ def test_static_import_and_object_config():
 
         # Check that the output is correct
         assert output_message.get_data("previous") == {"text": "Hello, World!"}
-
-    except Exception as e:
-        pytest.fail(f"Test failed with exception: {e}")
     finally:
-        if "connector" in locals():
-            dispose_connector(connector)
+        dispose_connector(connector)
 
 
 def test_bad_module():
     """Test that the program exits if the component module is not found"""
-    try:
-        config_yaml = """
+    config_yaml = """
 log:
   log_file_level: DEBUG
   log_file: solace_ai_connector.log
@@ -203,14 +189,9 @@ flows:
       - component_name: delay1
         component_module: not_a_module
 """
-        sac = SolaceAiConnector(
-            yaml.safe_load(config_yaml),
-        )
-        sac.run()
-    except Exception as e:
-        assert str(e) == "Module 'not_a_module' not found"
-    finally:
-        print("Finally")
+    with pytest.raises(ModuleNotFoundError) as e:
+        create_connector(config_yaml)
+    assert str(e.value) == "Module 'not_a_module' not found"
 
 
 def test_component_missing_info_attribute():
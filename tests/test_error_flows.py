@@ -1,25 +1,25 @@
 """This file contains tests for configured flows to handle errors"""
 
-import sys
-
-sys.path.append("src")
-
 # import queue
 
-from solace_ai_connector.test_utils.utils_for_test_files import (  # pylint: disable=wrong-import-position
+import pytest
+
+from solace_ai_connector.test_utils.utils_for_test_files import (
     create_test_flows,
     # create_and_run_component,
     dispose_connector,
     send_message_to_flow,
     get_message_from_flow,
 )
-from solace_ai_connector.common.message import (  # pylint: disable=wrong-import-position
+from solace_ai_connector.common.message import (
     Message,
 )
 
 
-def test_basic_error_flow():
-    """Test the basic error flow"""
+@pytest.fixture(scope="module")
+def output_message():
+    """Push one failure through the basic error flow and return what came out.
+    The tests below each check a different part of it"""
     # Create a simple configuration
     config_yaml = """
 instance_name: test_instance
@@ -51,17 +51,39 @@ flows:
     input_flow = flows[0]
     output_flow = flows[1]
 
-    # Send a message to the input flow
-    send_message_to_flow(input_flow, Message(payload={"text": "Hello, World!"}))
-
-    # Get the output message
-    output_message = get_message_from_flow(output_flow)
-
     try:
-        assert output_message.get_data("previous") == "This is an error message"
+        # Send a message to the input flow
+        send_message_to_flow(input_flow, Message(payload={"text": "Hello, World!"}))
 
-        error = output_message.get_data("input.payload")["error"]
-        assert error["exception"] == "ValueError"
-        assert error["text"] == "This is an error message"
+        # Get the output message
+        yield get_message_from_flow(output_flow)
     finally:
         dispose_connector(connector)
+
+
+def test_basic_error_flow(output_message):
+    """Test that the error flow selects the error text"""
+    assert output_message.get_data("previous") == "This is an error message"
+
+
+def test_error_details(output_message):
+    """Test that the error message describes the exception"""
+    error = output_message.get_data("input.payload")["error"]
+    assert error["exception"] == "ValueError"
+    assert error["text"] == "This is an error message"
+
+
+def test_error_location(output_message):
+    """Test that the error message names the component that failed"""
+    assert output_message.get_data("input.payload")["location"] == {
+        "instance": "test_instance",
+        "flow": "fail_flow",
+        "component": "fail",
+        "component_index": 0,
+    }
+
+
+def test_error_original_message(output_message):
+    """Test that the error message carries the message that failed"""
+    payload = output_message.get_data("input.payload")
+    assert payload["message"]["payload"] == {"text": "Hello, World!"}
@@ -1,10 +1,6 @@
 """Some tests to verify the filter component works as expected"""
 
-import sys
-
-sys.path.append("src")
-
-# import pytest
+import pytest
 
 from solace_ai_connector.test_utils.utils_for_test_files import (
     create_test_flows,
@@ -19,9 +15,38 @@ from solace_ai_connector.common.message import Message
 # from solace_ai_connector.common.log import log
 
 
-def test_simple_filter():
-    """Test the filter component with a simple expression"""
-    config_yaml = """
+# Each case is a filter condition, with its value as YAML, and three messages, of
+# which the filter must pass the first and last
+FILTER_CASES = [
+    pytest.param(
+        "equal",
+        "evaluate_expression(input.payload:my_list.1)",
+        "2",
+        [
+            {"my_list": [1, 2, 3]},
+            {"my_list": [4, 5, 6]},
+            {"my_list": [3, 2, 1]},
+        ],
+        id="simple_filter",
+    ),
+    pytest.param(
+        "not_equal",
+        "evaluate_expression(input.payload:my_list)",
+        "null",
+        [
+            {"my_list": [1, 2, 3], "my_obj": {"a": 1, "b": 2}},
+            {"my_obj": {"a": 1, "b": 2}},
+            {"my_list": [3, 2, 1], "my_obj": {"a": 1, "b": 2}},
+        ],
+        id="missing_item_filter",
+    ),
+]
+
+
+@pytest.mark.parametrize("function,expression,value,payloads", FILTER_CASES)
+def test_filter(function, expression, value, payloads):
+    """Test the filter component with an expression on the input payload"""
+    config_yaml = f"""
 log:
   log_file_level: DEBUG
   log_file: solace_ai_connector.log
@@ -34,67 +59,19 @@ flows:
           filter_expression:
             invoke:
               module: invoke_functions
-              function: equal
+              function: {function}
               params:
                 positional:
-                  - evaluate_expression(input.payload:my_list.1)
-                  - 2
+                  - {expression}
+                  - {value}
 """
     connector, flows = create_test_flows(config_yaml)
     flow = flows[0]
 
     try:
         # Send 3 messages - the first and last should be sent
-        message = Message(payload={"my_list": [1, 2, 3]})
-        send_message_to_flow(flow, message)
-        message = Message(payload={"my_list": [4, 5, 6]})
-        send_message_to_flow(flow, message)
-        message = Message(payload={"my_list": [3, 2, 1]})
-        send_message_to_flow(flow, message)
-
-        # Expect two messages to be sent
-        output_message = get_message_from_flow(flow)
-        assert output_message.get_data("input.payload:my_list") == [1, 2, 3]
-
-        output_message = get_message_from_flow(flow)
-        assert output_message.get_data("input.payload:my_list") == [3, 2, 1]
-    finally:
-        # Clean up
-        dispose_connector(connector)
-
-
-def test_missing_item_filter():
-    """Test the filter component with data items that are missing"""
-    config_yaml = """
-log:
-  log_file_level: DEBUG
-  log_file: solace_ai_connector.log
-flows:
-  - name: test_flow
-    components:
-      - component_name: message_filter
-        component_module: message_filter
-        component_config:
-          filter_expression:
-            invoke:
-              module: invoke_functions
-              function: not_equal
-              params:
-                positional:
-                  - evaluate_expression(input.payload:my_list)
-                  - null
-"""
-    connector, flows = create_test_flows(config_yaml)
-    try:
-        flow = flows[0]
-
-        # Send 2 messages
-        message = Message(payload={"my_list": [1, 2, 3], "my_obj": {"a": 1, "b": 2}})
-        send_message_to_flow(flow, message)
-        message = Message(payload={"my_obj": {"a": 1, "b": 2}})
-        send_message_to_flow(flow, message)
-        message = Message(payload={"my_list": [3, 2, 1], "my_obj": {"a": 1, "b": 2}})
-        send_message_to_flow(flow, message)
+        for payload in payloads:
+            send_message_to_flow(flow, Message(payload=payload))
 
         # Expect two messages to be sent
         output_message = get_message_from_flow(flow)
@@ -181,7 +158,7 @@ flows:
       - component_name: timer_input
         component_module: timer_input
         component_config:
-          interval_ms: 500
+          interval_ms: 50
           skip_messages_if_behind: false
       - component_name: user_processor
         component_module: user_processor
@@ -218,7 +195,8 @@ flows:
     flow = flows[0]
 
     try:
-        # Get the output messages (should be at least 3 seconds worth)
+        # Get the output messages. Only what the timer triggers matters here, not
+        # when it fires, so it ticks quickly
         for _ in range(3):
             msg = get_message_from_flow(flow)
             assert msg.get_data("user_data.output") == 11
@@ -1,10 +1,8 @@
 """This test file tests all things to do with the flows and the components that make up the flows"""
 
-import sys
+import time
 
-sys.path.append("src")
 import pytest
-import time
 
 from solace_ai_connector.test_utils.utils_for_test_files import (
     create_test_flows,
@@ -160,9 +158,34 @@ flows:
     dispose_connector(connector)
 
     # Verify that the on_flow_creation event was called
-    assert len(flows) == 2
-    assert flows[0].name == "test_flow"
-    assert flows[1].name == "test_flow2"
+    assert [flow.name for flow in flows] == ["test_flow", "test_flow2"]
+
+
+@pytest.mark.parametrize("num_instances", [1, 3, 8])
+def test_flow_num_instances(num_instances):
+    """Test that the connector creates one flow per flow instance"""
+    config_yaml = f"""
+log:
+  log_file_level: DEBUG
+  log_file: solace_ai_connector.log
+flows:
+  - name: test_flow
+    num_instances: {num_instances}
+    components:
+      - component_name: pass_through
+        component_module: pass_through
+"""
+    connector = create_connector(config_yaml)
+    try:
+        flows = connector.get_flows()
+        assert [flow.name for flow in flows] == ["test_flow"] * num_instances
+        assert [flow.flow_instance_index for flow in flows] == list(
+            range(num_instances)
+        )
+        assert connector.get_flow("test_flow") is flows[0]
+        assert connector.get_flow("unknown_flow") is None
+    finally:
+        dispose_connector(connector)
 
 
 def test_multiple_flow_instances():
@@ -202,3 +225,54 @@ flows:
     assert end_time - start_time > 3
 
     dispose_connector(connector)
+
+
+def test_stop_during_delay():
+    """Test that stopping the connector doesn't wait for a delay to pass"""
+    config_yaml = """
+log:
+  log_file_level: DEBUG
+  log_file: solace_ai_connector.log
+flows:
+  - name: test_flow
+    components:
+      - component_name: delay1
+        component_module: delay
+        component_config:
+          delay: 30
+"""
+    connector, flows = create_test_flows(config_yaml)
+    send_message_to_flow(flows[0], Message(payload={"text": "Hello, World!"}))
+
+    start_time = time.time()
+    dispose_connector(connector)
+    assert time.time() - start_time < 5
+
+
+def test_stop_more_instances_than_queue_depth():
+    """Test that stopping wakes every instance blocked on a shared input queue,
+    even when there are more instances than the queue can hold"""
+    config_yaml = """
+log:
+  log_file_level: DEBUG
+  log_file: solace_ai_connector.log
+flows:
+  - name: test_flow
+    components:
+      - component_name: pass_through
+        component_module: pass_through
+        num_instances: 8
+        component_queue_max_depth: 2
+        input_selection:
+          source_expression: input.payload
+"""
+    connector, flows = create_test_flows(config_yaml)
+    try:
+        # Have one instance handle a message, so all of them are blocked on the
+        # queue again before the stop
+        send_message_to_flow(flows[0], Message(payload={"text": "Hello, World!"}))
+        output_message = get_message_from_flow(flows[0])
+        assert output_message.get_data("previous") == {"text": "Hello, World!"}
+    finally:
+        # dispose_connector raises if any of the flow threads is left running
+        dispose_connector(connector)
@@ -1,11 +1,7 @@
 """This file tests the utils functions that execute the invoke configuration specification"""
 
-import sys
 import pytest
 
-sys.path.append("src")
-
-
 from solace_ai_connector.test_utils.utils_for_test_files import (
     create_and_run_component,
 )
@@ -604,96 +600,65 @@ def test_invoke_with_evaluate_expression_simple():
     assert config == {"source_expression": 3}
 
 
-def test_invoke_with_evaluate_expression_cast_to_int():
-    """Verify that the evaluate expression is evaluated"""
-    config = resolve_config_values(
-        {
-            "source_expression": {
-                "invoke": {
-                    "module": "invoke_functions",
-                    "function": "add",
-                    "params": {
-                        "positional": [
-                            "evaluate_expression(input.payload:my_obj.val1, int )",
-                            2,
-                        ],
-                    },
-                },
-            },
-        }
-    )
-    message = Message(payload={"my_obj": {"val1": "1"}})
-    config["source_expression"] = config["source_expression"](message)
-    assert config == {"source_expression": 3}
-
-
-def test_invoke_with_evaluate_expression_cast_to_float():
-    """Verify that the evaluate expression is evaluated"""
-    config = resolve_config_values(
-        {
-            "source_expression": {
-                "invoke": {
-                    "module": "invoke_functions",
-                    "function": "add",
-                    "params": {
-                        "positional": [
-                            "evaluate_expression(input.payload:my_obj.val1, float )",
-                            2,
-                        ],
-                    },
-                },
-            },
-        }
-    )
-    message = Message(payload={"my_obj": {"val1": "1.1"}})
-    config["source_expression"] = config["source_expression"](message)
-    assert config == {"source_expression": 3.1}
-
-
-def test_invoke_with_source_expression_cast_to_bool():
-    """Verify that the source expression is evaluated"""
-    config = resolve_config_values(
-        {
-            "source_expression": {
-                "invoke": {
-                    "module": "invoke_functions",
-                    "function": "and_op",
-                    "params": {
-                        "positional": [
-                            "evaluate_expression(input.payload:my_obj.val1 , bool )",
-                            True,
-                        ],
-                    },
-                },
-            },
-        }
-    )
-    message = Message(payload={"my_obj": {"val1": "True"}})
-    config["source_expression"] = config["source_expression"](message)
-    assert config == {"source_expression": True}
+# Each case is a function, an evaluate_expression with a cast, the other argument,
+# the input value and the expected result
+CAST_CASES = [
+    pytest.param(
+        "add",
+        "evaluate_expression(input.payload:my_obj.val1, int )",
+        2,
+        "1",
+        3,
+        id="int",
+    ),
+    pytest.param(
+        "add",
+        "evaluate_expression(input.payload:my_obj.val1, float )",
+        2,
+        "1.1",
+        3.1,
+        id="float",
+    ),
+    pytest.param(
+        "and_op",
+        "evaluate_expression(input.payload:my_obj.val1 , bool )",
+        True,
+        "True",
+        True,
+        id="bool",
+    ),
+    pytest.param(
+        "add",
+        "evaluate_expression(input.payload:my_obj.val1,str)",
+        "2",
+        1,
+        "12",
+        id="str",
+    ),
+]
 
 
-def test_invoke_with_evaluate_expression_cast_to_str():
-    """Verify that the evaluate expression is evaluated"""
+@pytest.mark.parametrize("function,expression,other,value,expected", CAST_CASES)
+def test_invoke_with_evaluate_expression_cast(
+    function, expression, other, value, expected
+):
+    """Verify that the evaluate expression is evaluated and cast"""
     config = resolve_config_values(
         {
             "source_expression": {
                 "invoke": {
                     "module": "invoke_functions",
-                    "function": "add",
+                    "function": function,
                     "params": {
-                        "positional": [
-                            "evaluate_expression(input.payload:my_obj.val1,str)",
-                            "2",
-                        ],
+                        "positional": [expression, other],
                     },
                 },
             },
         }
     )
-    message = Message(payload={"my_obj": {"val1": 1}})
+    message = Message(payload={"my_obj": {"val1": value}})
     config["source_expression"] = config["source_expression"](message)
-    assert config == {"source_expression": "12"}
+    assert config == {"source_expression": expected}
 
 
 def test_invoke_with_evaluate_expression_keyword():
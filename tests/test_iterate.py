@@ -1,10 +1,6 @@
 """Some tests to verify the iterate component works as expected"""
 
-import sys
-
-sys.path.append("src")
-
-# import pytest
+import pytest
 
 from solace_ai_connector.test_utils.utils_for_test_files import (
     create_test_flows,
@@ -19,8 +15,9 @@ from solace_ai_connector.common.message import Message
 # from solace_ai_connector.common.log import log
 
 
-def test_small_list():
-    """Test the iterate component with a small list"""
+@pytest.fixture(scope="module")
+def flow():
+    """One connector for the module - every test drains all of its output"""
     config_yaml = """
 log:
   log_file_level: DEBUG
@@ -34,8 +31,14 @@ flows:
           source_expression: input.payload:my_list
 """
     connector, flows = create_test_flows(config_yaml)
-    flow = flows[0]
+    yield flows[0]
+
+    # Clean up
+    dispose_connector(connector)
+
 
+def test_small_list(flow):
+    """Test the iterate component with a small list"""
     # Send a list of 3 items
     message = Message(payload={"my_list": [1, 2, 3]})
     send_message_to_flow(flow, message)
@@ -45,27 +48,9 @@ flows:
         output_message = get_message_from_flow(flow)
         assert output_message.get_data("previous") == i + 1
 
-    # Clean up
-    dispose_connector(connector)
-
 
-def test_large_list():
+def test_large_list(flow):
     """Test the iterate component with a large list"""
-    config_yaml = """
-log:
-  log_file_level: DEBUG
-  log_file: solace_ai_connector.log
-flows:
-  - name: test_flow
-    components:
-      - component_name: iterate
-        component_module: iterate
-        input_selection:
-          source_expression: input.payload:my_list
-"""
-    connector, flows = create_test_flows(config_yaml)
-    flow = flows[0]
-
     # Send a list of 100 items
     list_100 = []
     for i in range(100):
@@ -77,6 +62,3 @@ flows:
     for i in range(100):
         output_message = get_message_from_flow(flow)
         assert output_message.get_data("previous") == {"num": i}
-
-    # Clean up
-    dispose_connector(connector)
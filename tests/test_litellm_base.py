@@ -0,0 +1,98 @@
+"""Test the load balancer configuration validation of the LiteLLM components"""
+
+import pytest
+
+from solace_ai_connector.components.general.llm.litellm.litellm_base import (
+    LiteLLMBase,
+)
+from solace_ai_connector.test_utils.utils_for_test_files import (
+    create_connector,
+    dispose_connector,
+)
+
+
+def make_config(load_balancer, num_instances=1):
+    return {
+        "log": {"log_file_level": "DEBUG", "log_file": "solace_ai_connector.log"},
+        "flows": [
+            {
+                "name": "test_flow",
+                "components": [
+                    {
+                        "component_name": "llm",
+                        "component_module": "litellm_chat_model",
+                        "component_config": {"load_balancer": load_balancer},
+                        "num_instances": num_instances,
+                    }
+                ],
+            }
+        ],
+    }
+
+
+# Each case is a load_balancer config and the error it is expected to raise
+INVALID_LOAD_BALANCERS = [
+    pytest.param(
+        "",
+        "'load_balancer' must be a non-empty list of models",
+        id="missing_load_balancer",
+    ),
+    pytest.param(
+        [{"litellm_params": {"model": "openai/gpt-4o"}}],
+        "Missing 'model_name' in load_balancer entry 0",
+        id="missing_model_name",
+    ),
+    pytest.param(
+        [{"model_name": "gpt-4o"}],
+        "Missing 'litellm_params' for load_balancer model 'gpt-4o'",
+        id="missing_litellm_params",
+    ),
+    pytest.param(
+        [{"model_name": "gpt-4o", "litellm_params": {"api_key": "test"}}],
+        "Missing 'model' in 'litellm_params' for load_balancer model 'gpt-4o'",
+        id="missing_model",
+    ),
+]
+
+
+@pytest.mark.parametrize("load_balancer,expected_error", INVALID_LOAD_BALANCERS)
+def test_invalid_load_balancer(load_balancer, expected_error):
+    """Test that an invalid load_balancer config is rejected"""
+    # The validation only looks at its argument, so skip __init__ and don't
+    # leave a half-built connector behind
+    component = LiteLLMBase.__new__(LiteLLMBase)
+    with pytest.raises(ValueError) as e:
+        component.validate_model_config(load_balancer)
+    assert str(e.value) == expected_error
+
+
+@pytest.fixture(scope="module")
+def components():
+    """The instances of a valid LiteLLM component, from one connector that all
+    the tests below share"""
+    connector = create_connector(
+        make_config(
+            [
+                {
+                    "model_name": "gpt-4o",
+                    "litellm_params": {"model": "openai/gpt-4o", "api_key": "test"},
+                }
+            ],
+            num_instances=2,
+        )
+    )
+    try:
+        yield connector.get_flows()[0].component_groups[0]
+    finally:
+        dispose_connector(connector)
+
+
+def test_valid_load_balancer(components):
+    """Test that a valid load_balancer config creates the router"""
+    assert components[0].router is not None
+    assert components[0].router.get_model_names() == ["gpt-4o"]
+
+
+def test_instances_share_router(components):
+    """Test that instances with the same load_balancer config share a router"""
+    assert components[1].router is components[0].router
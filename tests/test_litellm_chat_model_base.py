@@ -0,0 +1,216 @@
+"""Unit tests for the LiteLLM chat model base component"""
+
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, patch
+
+import pytest
+from litellm import APIConnectionError
+
+from solace_ai_connector.common.message import (
+    Message,
+)
+from solace_ai_connector.components.general.llm.litellm.litellm_chat_model_base import (
+    LiteLLMChatModelBase,
+    litellm_chat_info_base,
+)
+
+pytestmark = pytest.mark.usefixtures("router_class")
+
+# None of the code under test mutates the message list, so it is shared
+USER_MESSAGES = [{"role": "user", "content": "Hello"}]
+
+API_ERROR = APIConnectionError(
+    message="API connection failed", llm_provider="openai", model="gpt-4o"
+)
+
+
+def fake_response(content):
+    """A completion response with just the attributes the component reads"""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+    )
+
+
+@pytest.fixture
+def create_component(valid_load_balancer_config):
+    def _create_component(sibling_component=None, **component_config):
+        return LiteLLMChatModelBase(
+            litellm_chat_info_base,
+            config={
+                "component_name": "test_llm",
+                "component_config": {
+                    "load_balancer": valid_load_balancer_config,
+                    **component_config,
+                },
+            },
+            sibling_component=sibling_component,
+        )
+
+    return _create_component
+
+
+DEFAULTS_EXPECTED = {
+    "llm_mode": "none",
+    "stream_batch_size": 15,
+    "stream_to_flow": "",
+    "stream_to_next_component": False,
+}
+
+CUSTOM_CONFIG = {
+    "llm_mode": "stream",
+    "stream_batch_size": 5,
+    "stream_to_flow": "stream_flow",
+}
+
+
+@pytest.mark.parametrize(
+    "component_config,expected",
+    [
+        pytest.param({}, DEFAULTS_EXPECTED, id="defaults"),
+        pytest.param(
+            CUSTOM_CONFIG,
+            {**DEFAULTS_EXPECTED, **CUSTOM_CONFIG},
+            id="custom_config",
+        ),
+    ],
+)
+def test_initialization(
+    create_component,
+    valid_load_balancer_config,
+    router_class,
+    router_mock,
+    component_config,
+    expected,
+):
+    """Test that the component picks up its config values"""
+    component = create_component(**component_config)
+
+    router_class.assert_called_once_with(model_list=valid_load_balancer_config)
+    assert component.router is router_mock
+    for key, value in expected.items():
+        assert getattr(component, key) == value
+
+
+def test_router_shared_with_sibling(create_component, router_class):
+    """Test that the instances of a component reuse one router"""
+    first = create_component()
+    second = create_component(sibling_component=first)
+
+    router_class.assert_called_once()
+    assert second.router is first.router
+
+
+def test_router_not_shared_between_components(create_component, router_class):
+    """Test that separate components with the same models get their own routers"""
+    create_component()
+    create_component()
+
+    assert router_class.call_count == 2
+
+
+def test_stream_to_flow_and_next_component_are_exclusive(create_component):
+    """Test that stream_to_flow and stream_to_next_component can't both be set"""
+    with pytest.raises(ValueError) as e:
+        create_component(stream_to_flow="stream_flow", stream_to_next_component=True)
+    assert "mutually exclusive" in str(e.value)
+
+
+@pytest.mark.parametrize(
+    "component_config,data,stream_expected",
+    [
+        pytest.param({}, {"messages": USER_MESSAGES}, False, id="non_stream_mode"),
+        pytest.param(
+            {"llm_mode": "stream", "stream_to_flow": "stream_flow"},
+            {"messages": USER_MESSAGES},
+            True,
+            id="stream_mode",
+        ),
+        pytest.param(
+            {"stream_to_flow": "stream_flow"},
+            {"messages": USER_MESSAGES, "stream": True},
+            True,
+            id="explicit_stream_param",
+        ),
+        pytest.param(
+            {"llm_mode": "stream", "stream_to_flow": "stream_flow"},
+            {"messages": USER_MESSAGES, "stream": False},
+            False,
+            id="explicit_non_stream_param",
+        ),
+    ],
+)
+def test_invoke_dispatch(
+    create_component, mock_message, component_config, data, stream_expected
+):
+    """Test that invoke picks the streaming path from llm_mode or the stream input"""
+    component = create_component(**component_config)
+
+    with patch.multiple(
+        LiteLLMChatModelBase, invoke_non_stream=DEFAULT, invoke_stream=DEFAULT
+    ) as mocks:
+        component.invoke(mock_message, data)
+
+    if stream_expected:
+        mocks["invoke_stream"].assert_called_once_with(mock_message, USER_MESSAGES)
+        mocks["invoke_non_stream"].assert_not_called()
+    else:
+        mocks["invoke_non_stream"].assert_called_once_with(USER_MESSAGES)
+        mocks["invoke_stream"].assert_not_called()
+
+
+def test_invoke_non_stream_success(create_component, router_mock):
+    """Test that the content of the model response is returned"""
+    component = create_component()
+    router_mock.completion.return_value = fake_response("Hello, I'm an AI")
+
+    result = component.invoke_non_stream(USER_MESSAGES)
+
+    assert result == {"content": "Hello, I'm an AI"}
+    router_mock.completion.assert_called_once_with(
+        model="gpt-4o",
+        messages=USER_MESSAGES,
+        stream=False,
+    )
+
+
+@patch.object(LiteLLMChatModelBase, "load_balance")
+def test_invoke_non_stream_api_error(mock_load_balance, create_component, monkeypatch):
+    """Test that the error is raised once the retries are used up"""
+    sleeps = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    component = create_component()
+    mock_load_balance.side_effect = API_ERROR
+
+    with pytest.raises(APIConnectionError):
+        component.invoke_non_stream(USER_MESSAGES)
+
+    assert mock_load_balance.call_count == 3
+    assert sleeps == [1, 1]
+
+
+def test_send_streaming_message():
+    """Test that a streamed chunk is sent to stream_to_flow with the user properties"""
+    # Only stream_to_flow and send_to_flow are touched, so skip __init__
+    component = LiteLLMChatModelBase.__new__(LiteLLMChatModelBase)
+    component.stream_to_flow = "stream_flow"
+    sent = []
+    component.send_to_flow = lambda flow_name, message: sent.append(
+        (flow_name, message)
+    )
+    input_message = Message(payload={}, user_properties={"session": "s1"})
+
+    component.send_streaming_message(
+        input_message, "Hello", "Hello", "uuid-1", first_chunk=True
+    )
+
+    [(flow_name, message)] = sent
+    assert flow_name == "stream_flow"
+    assert message.get_user_properties() == {"session": "s1"}
+    assert message.get_payload() == {
+        "chunk": "Hello",
+        "content": "Hello",
+        "response_uuid": "uuid-1",
+        "first_chunk": True,
+        "last_chunk": False,
+        "streaming": True,
+    }
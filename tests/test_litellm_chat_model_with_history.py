@@ -0,0 +1,239 @@
+"""Unit tests for the LiteLLM chat model component with conversation history"""
+
+import time
+from contextlib import nullcontext
+from unittest.mock import ANY, MagicMock, patch
+
+import pytest
+
+from solace_ai_connector.components.general.llm.litellm.litellm_base import (
+    LiteLLMBase,
+)
+from solace_ai_connector.components.general.llm.litellm.litellm_chat_model_base import (
+    LiteLLMChatModelBase,
+)
+from solace_ai_connector.components.general.llm.litellm.litellm_chat_model_with_history import (
+    LiteLLMChatModelWithHistory,
+    info,
+)
+
+CONFIG_PARAM_NAMES = frozenset(param["name"] for param in info["config_parameters"])
+
+
+@pytest.fixture(scope="module", autouse=True)
+def stub_init_load_balancer():
+    """The model call itself is stubbed, so these tests never need a router"""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(LiteLLMBase, "init_load_balancer", lambda self: None)
+        yield
+
+
+@pytest.fixture(scope="module")
+def kv_store():
+    return {}
+
+
+@pytest.fixture(scope="module")
+def shared_component(kv_store, valid_load_balancer_config):
+    """Built once per module - the tests only change the kv_store contents"""
+    component = LiteLLMChatModelWithHistory(
+        config={
+            "component_name": "test_llm",
+            "component_config": {"load_balancer": valid_load_balancer_config},
+        }
+    )
+    # The lock is only there to serialize access to the kv_store - bypass it
+    component.get_lock = lambda _lock_name: nullcontext()
+    component.kv_store_get = MagicMock(side_effect=kv_store.get)
+    component.kv_store_set = MagicMock(side_effect=kv_store.__setitem__)
+    component.kv_store_delete = MagicMock(side_effect=kv_store.pop)
+    return component
+
+
+@pytest.fixture
+def component(shared_component, kv_store):
+    kv_store.clear()
+    shared_component.kv_store_get.reset_mock()
+    shared_component.kv_store_set.reset_mock()
+    shared_component.kv_store_delete.reset_mock()
+    return shared_component
+
+
+def test_info_dictionary():
+    """Test that the component adds the history settings to the base config"""
+    assert info["class_name"] == "LiteLLMChatModelWithHistory"
+    assert CONFIG_PARAM_NAMES >= {
+        "load_balancer",
+        "history_max_turns",
+        "history_max_time",
+    }
+    assert "clear_history_but_keep_depth" in info["input_schema"]["properties"]
+
+
+def invoke_with_response(component, message, data, content="Hi there"):
+    with patch.object(
+        LiteLLMChatModelBase, "invoke", return_value={"content": content}
+    ) as mock_invoke:
+        response = component.invoke(message, data)
+    return response, mock_invoke
+
+
+def seed_session(component, kv_store, session_id, messages, last_accessed=None):
+    kv_store.setdefault(component.history_key, set()).add(session_id)
+    kv_store[component.get_session_history_key(session_id)] = {
+        "messages": messages,
+        "last_accessed": time.time() if last_accessed is None else last_accessed,
+    }
+
+
+def stored_messages(component, kv_store, session_id="s1"):
+    return kv_store[component.get_session_history_key(session_id)]["messages"]
+
+
+def test_invoke_with_new_session(component, kv_store, mock_message):
+    """Test that a new session starts its history with the exchange"""
+    response, _ = invoke_with_response(
+        component,
+        mock_message,
+        {"session_id": "s1", "messages": [{"role": "user", "content": "Hello"}]},
+    )
+
+    assert response == {"content": "Hi there"}
+    assert kv_store[component.history_key] == {"s1"}
+    assert stored_messages(component, kv_store) == [
+        {"role": "user", "content": "Hello"},
+        {"role": "assistant", "content": "Hi there"},
+    ]
+
+
+def test_invoke_with_existing_session(component, kv_store, mock_message):
+    """Test that new messages are appended and only that session is rewritten"""
+    seed_session(
+        component,
+        kv_store,
+        "s1",
+        [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi there"},
+        ],
+    )
+    seed_session(component, kv_store, "s2", [{"role": "user", "content": "Other"}])
+
+    invoke_with_response(
+        component,
+        mock_message,
+        {"session_id": "s1", "messages": [{"role": "user", "content": "And now?"}]},
+        content="Now this",
+    )
+
+    assert stored_messages(component, kv_store) == [
+        {"role": "user", "content": "Hello"},
+        {"role": "assistant", "content": "Hi there"},
+        {"role": "user", "content": "And now?"},
+        {"role": "assistant", "content": "Now this"},
+    ]
+    component.kv_store_set.assert_called_once_with(
+        component.get_session_history_key("s1"), ANY
+    )
+
+
+def test_system_message_replacement(component, kv_store, mock_message):
+    """Test that a new system message replaces the one at the head of the history"""
+    seed_session(
+        component,
+        kv_store,
+        "s1",
+        [
+            {"role": "system", "content": "Old system"},
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi there"},
+        ],
+    )
+
+    invoke_with_response(
+        component,
+        mock_message,
+        {
+            "session_id": "s1",
+            "messages": [
+                {"role": "system", "content": "New system"},
+                {"role": "user", "content": "And now?"},
+            ],
+        },
+    )
+
+    messages = stored_messages(component, kv_store)
+    assert messages[0] == {"role": "system", "content": "New system"}
+    assert [m["role"] for m in messages].count("system") == 1
+
+
+def test_clear_history_but_keep_depth(component, kv_store, mock_message):
+    """Test that clearing the history keeps the last messages from a user turn"""
+    seed_session(
+        component,
+        kv_store,
+        "s1",
+        [
+            {"role": "user", "content": "One"},
+            {"role": "assistant", "content": "Reply one"},
+            {"role": "user", "content": "Two"},
+            {"role": "assistant", "content": "Reply two"},
+        ],
+    )
+
+    invoke_with_response(
+        component,
+        mock_message,
+        {
+            "session_id": "s1",
+            "messages": [{"role": "user", "content": "Three"}],
+            "clear_history_but_keep_depth": 2,
+        },
+        content="Reply three",
+    )
+
+    assert stored_messages(component, kv_store) == [
+        {"role": "user", "content": "Two"},
+        {"role": "assistant", "content": "Reply two"},
+        {"role": "user", "content": "Three"},
+        {"role": "assistant", "content": "Reply three"},
+    ]
+
+
+def test_prune_history_keeps_last_turns(component):
+    """Test that pruning trims the stored list in place to history_max_turns"""
+    messages = [
+        {"role": "user" if index % 2 == 0 else "assistant", "content": str(index)}
+        for index in range(component.history_max_turns * 2 + 4)
+    ]
+    history = {"s1": {"messages": messages, "last_accessed": time.time()}}
+
+    component.prune_history("s1", history)
+
+    assert history["s1"]["messages"] is messages
+    assert len(messages) == component.history_max_turns * 2
+    assert messages[0] == {"role": "user", "content": "4"}
+
+
+def test_history_age_out(component, kv_store):
+    """Test that only the sessions idle for longer than history_max_time are removed"""
+    seed_session(
+        component,
+        kv_store,
+        "old",
+        [{"role": "user", "content": "Hello"}],
+        last_accessed=time.time() - component.history_max_time - 1,
+    )
+    seed_session(component, kv_store, "new", [{"role": "user", "content": "Hello"}])
+
+    component.history_age_out()
+
+    assert kv_store[component.history_key] == {"new"}
+    assert component.get_session_history_key("old") not in kv_store
+    assert component.get_session_history_key("new") in kv_store
+
+
+def test_session_id_is_required(component, mock_message):
+    """Test that invoking without a session_id fails"""
+    with pytest.raises(ValueError):
+        component.invoke(mock_message, {"messages": []})
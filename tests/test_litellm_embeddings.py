@@ -0,0 +1,136 @@
+"""Unit tests for the LiteLLM embeddings component"""
+
+import pytest
+
+from solace_ai_connector.components.general.llm.litellm.litellm_embeddings import (
+    LiteLLMEmbeddings,
+)
+
+pytestmark = pytest.mark.usefixtures("router_class")
+
+
+def embedding_response(*texts):
+    """An embedding response with a one-element vector per text"""
+    return {"data": [{"embedding": [float(len(text))]} for text in texts]}
+
+
+@pytest.fixture
+def create_component(valid_load_balancer_config):
+    def _create_component(**component_config):
+        return LiteLLMEmbeddings(
+            config={
+                "component_name": "test_embeddings",
+                "component_config": {
+                    "load_balancer": valid_load_balancer_config,
+                    **component_config,
+                },
+            },
+        )
+
+    return _create_component
+
+
+def test_invoke_with_single_item(create_component, router_mock, mock_message):
+    """Test that a single item is embedded as a list of one"""
+    component = create_component()
+    router_mock.embedding.return_value = embedding_response("Hello")
+
+    result = component.invoke(mock_message, {"items": "Hello"})
+
+    assert result == {"embeddings": [[5.0]]}
+    router_mock.embedding.assert_called_once_with(model="gpt-4o", input=["Hello"])
+
+
+def test_invoke_reuses_cached_embeddings(create_component, router_mock, mock_message):
+    """Test that only the items not embedded before are sent to the model"""
+    component = create_component()
+    router_mock.embedding.return_value = embedding_response("Hello", "Hi")
+    component.invoke(mock_message, {"items": ["Hello", "Hi"]})
+
+    router_mock.embedding.reset_mock()
+    router_mock.embedding.return_value = embedding_response("Goodbye")
+    result = component.invoke(mock_message, {"items": ["Hi", "Goodbye", "Hello"]})
+
+    assert result == {"embeddings": [[2.0], [7.0], [5.0]]}
+    router_mock.embedding.assert_called_once_with(model="gpt-4o", input=["Goodbye"])
+
+
+def test_invoke_fully_cached(create_component, router_mock, mock_message):
+    """Test that the model is not called when every item is cached"""
+    component = create_component()
+    router_mock.embedding.return_value = embedding_response("Hello")
+    component.invoke(mock_message, {"items": ["Hello"]})
+    router_mock.embedding.reset_mock()
+
+    result = component.invoke(mock_message, {"items": ["Hello"]})
+
+    assert result == {"embeddings": [[5.0]]}
+    router_mock.embedding.assert_not_called()
+
+
+def test_cached_embedding_is_a_copy(create_component, router_mock, mock_message):
+    """Test that changing a returned embedding doesn't change the cached one"""
+    component = create_component()
+    router_mock.embedding.return_value = embedding_response("Hello")
+    first = component.invoke(mock_message, {"items": ["Hello"]})
+    first["embeddings"][0].append(0.0)
+
+    second = component.invoke(mock_message, {"items": ["Hello"]})
+    assert second == {"embeddings": [[5.0]]}
+    second["embeddings"][0].append(0.0)
+
+    third = component.invoke(mock_message, {"items": ["Hello"]})
+    assert third == {"embeddings": [[5.0]]}
+
+
+def test_embedding_cache_evicts_least_recently_used(create_component):
+    """Test that the cache keeps at most embedding_cache_size entries"""
+    component = create_component(embedding_cache_size=2)
+
+    component.cache_embedding("one", [1.0])
+    component.cache_embedding("two", [2.0])
+    component.get_cached_embedding("one")
+    component.cache_embedding("three", [3.0])
+
+    assert list(component.embedding_cache) == ["one", "three"]
+
+
+def test_embedding_cache_disabled(create_component, router_mock, mock_message):
+    """Test that an embedding_cache_size of 0 sends every item to the model"""
+    component = create_component(embedding_cache_size=0)
+    router_mock.embedding.return_value = embedding_response("Hello")
+
+    component.invoke(mock_message, {"items": ["Hello"]})
+    component.invoke(mock_message, {"items": ["Hello"]})
+
+    assert router_mock.embedding.call_count == 2
+
+
+def test_invoke_splits_large_inputs_into_batches(
+    create_component, router_mock, mock_message
+):
+    """Test that large inputs are split into batches and merged back in order"""
+    component = create_component(embedding_batch_size=2, embedding_cache_size=0)
+    router_mock.embedding.side_effect = lambda model, input: embedding_response(
+        *input
+    )
+    items = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    result = component.invoke(mock_message, {"items": items})
+
+    assert result == {"embeddings": [[1.0], [2.0], [3.0], [4.0], [5.0]]}
+    sent_batches = sorted(
+        call.kwargs["input"] for call in router_mock.embedding.call_args_list
+    )
+    assert sent_batches == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+
+
+def test_invoke_rejects_missing_embeddings(create_component, router_mock, mock_message):
+    """Test that a response with fewer embeddings than items is an error"""
+    component = create_component()
+    router_mock.embedding.return_value = embedding_response("Hello")
+
+    with pytest.raises(ValueError) as e:
+        component.invoke(mock_message, {"items": ["Hello", "Hi"]})
+    assert str(e.value) == "Embedding model returned 1 embeddings for 2 items"
+    assert not component.embedding_cache
@@ -1,7 +1,5 @@
 """This test fixture will test the get_data and set_data methods of the Message class"""
 
-import sys
-sys.path.append("src")
 import json
 import base64
 import pytest
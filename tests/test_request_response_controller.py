@@ -1,6 +1,4 @@
-import sys
-
-sys.path.append("src")
+import pytest
 
 from solace_ai_connector.test_utils.utils_for_test_files import (
     create_test_flows,
@@ -11,23 +9,55 @@ from solace_ai_connector.test_utils.utils_for_test_files import (
 from solace_ai_connector.common.message import Message
 
 
-def test_request_response_flow_controller_basic():
-    """Test basic functionality of the RequestResponseFlowController"""
+# The invoke handlers for the requester components in the tests below
+def basic_invoke_handler(component, message, _data):
+    # Call the request_response
+    message = component.do_broker_request_response(message)
+    try:
+        assert message.get_data("previous") == {
+            "payload": {"text": "Hello, World!"},
+            "topic": None,
+            "user_properties": {},
+        }
+    except AssertionError as e:
+        return e
+    return "Pass"
+
+
+def streaming_invoke_handler(component, message, data):
+    result = []
+    for message, last_message in component.do_broker_request_response(
+        message, stream=True, streaming_complete_expression="input.payload:last"
+    ):
+        payload = message.get_data("input.payload")
+        result.append(payload)
+        if last_message:
+            assert payload == {"text": "Chunk3", "last": True}
+
+    assert result == [
+        {"text": "Chunk1", "last": False},
+        {"text": "Chunk2", "last": False},
+        {"text": "Chunk3", "last": True},
+    ]
+
+    return "Pass"
+
+
+def timeout_invoke_handler(component, message, data):
+    try:
+        for message, _last_message in component.do_broker_request_response(
+            message, stream=True, streaming_complete_expression="input.payload:last"
+        ):
+            pass
+    except TimeoutError:
+        return "Timeout"
+    return "Fail"
 
-    def test_invoke_handler(component, message, _data):
-        # Call the request_response
-        message = component.do_broker_request_response(message)
-        try:
-            assert message.get_data("previous") == {
-                "payload": {"text": "Hello, World!"},
-                "topic": None,
-                "user_properties": {},
-            }
-        except AssertionError as e:
-            return e
-        return "Pass"
-
-    config = {
+
+def requester_config(invoke_handler, broker_type, request_expiry_ms=500000):
+    """A flow with one requester component that uses the given test broker for
+    its request/response"""
+    return {
         "flows": [
             {
                 "name": "test_flow",
@@ -36,12 +66,12 @@ def test_request_response_flow_controller_basic():
                         "component_name": "requester",
                         "component_module": "handler_callback",
                         "component_config": {
-                            "invoke_handler": test_invoke_handler,
+                            "invoke_handler": invoke_handler,
                         },
                         "broker_request_response": {
                             "enabled": True,
                             "broker_config": {
-                                "broker_type": "test",
+                                "broker_type": broker_type,
                                 "broker_url": "test",
                                 "broker_username": "test",
                                 "broker_password": "test",
@@ -49,196 +79,86 @@ def test_request_response_flow_controller_basic():
                                 "payload_encoding": "utf-8",
                                 "payload_format": "json",
                             },
-                            "request_expiry_ms": 500000,
+                            "request_expiry_ms": request_expiry_ms,
                         },
                     }
                 ],
             },
         ]
     }
-    connector, flows = create_test_flows(config)
-
-    test_flow = flows[0]
-
-    try:
-
-        # Send a message to the input flow
-        send_message_to_flow(test_flow, Message(payload={"text": "Hello, World!"}))
 
-        # Get the output message
-        output_message = get_message_from_flow(test_flow)
 
-        result = output_message.get_data("previous")
+@pytest.fixture
+def create_requester_flow():
+    """Create the test flow of a connector built by requester_config - the
+    connectors are disposed of after the test"""
+    connectors = []
 
-        # if the result is an AssertionError, then raise it
-        if isinstance(result, AssertionError):
-            raise result
+    def _create_requester_flow(*args, **kwargs):
+        connector, flows = create_test_flows(requester_config(*args, **kwargs))
+        connectors.append(connector)
+        return flows[0]
 
-        assert result == "Pass"
-
-    except Exception as e:
-        print(e)
-        assert False
-
-    finally:
+    yield _create_requester_flow
+    for connector in connectors:
         dispose_connector(connector)
 
 
-# Test simple streaming request response
-# Use the iterate component to break a single message into multiple messages
-def test_request_response_flow_controller_streaming():
-    """Test streaming functionality of the RequestResponseFlowController"""
+def test_request_response_flow_controller_basic(create_requester_flow):
+    """Test basic functionality of the RequestResponseFlowController"""
+    test_flow = create_requester_flow(basic_invoke_handler, "test")
 
-    def test_invoke_handler(component, message, data):
-        result = []
-        for message, last_message in component.do_broker_request_response(
-            message, stream=True, streaming_complete_expression="input.payload:last"
-        ):
-            payload = message.get_data("input.payload")
-            result.append(payload)
-            if last_message:
-                assert payload == {"text": "Chunk3", "last": True}
-
-        assert result == [
-            {"text": "Chunk1", "last": False},
-            {"text": "Chunk2", "last": False},
-            {"text": "Chunk3", "last": True},
-        ]
+    # Send a message to the input flow
+    send_message_to_flow(test_flow, Message(payload={"text": "Hello, World!"}))
 
-        return "Pass"
+    # Get the output message
+    output_message = get_message_from_flow(test_flow)
 
-    config = {
-        "flows": [
-            {
-                "name": "test_flow",
-                "components": [
-                    {
-                        "component_name": "requester",
-                        "component_module": "handler_callback",
-                        "component_config": {
-                            "invoke_handler": test_invoke_handler,
-                        },
-                        "broker_request_response": {
-                            "enabled": True,
-                            "broker_config": {
-                                "broker_type": "test_streaming",
-                                "broker_url": "test",
-                                "broker_username": "test",
-                                "broker_password": "test",
-                                "broker_vpn": "test",
-                                "payload_encoding": "utf-8",
-                                "payload_format": "json",
-                            },
-                            "request_expiry_ms": 500000,
-                        },
-                    }
-                ],
-            },
-        ]
-    }
-    connector, flows = create_test_flows(config)
+    result = output_message.get_data("previous")
 
-    test_flow = flows[0]
+    # if the result is an AssertionError, then raise it
+    if isinstance(result, AssertionError):
+        raise result
 
-    try:
+    assert result == "Pass"
 
-        # Send a message to the input flow
-        send_message_to_flow(
-            test_flow,
-            Message(
-                payload=[
-                    {"text": "Chunk1", "last": False},
-                    {"text": "Chunk2", "last": False},
-                    {"text": "Chunk3", "last": True},
-                ]
-            ),
-        )
 
-        # Get the output message
-        output_message = get_message_from_flow(test_flow)
+# Test simple streaming request response
+# Use the iterate component to break a single message into multiple messages
+def test_request_response_flow_controller_streaming(create_requester_flow):
+    """Test streaming functionality of the RequestResponseFlowController"""
+    test_flow = create_requester_flow(streaming_invoke_handler, "test_streaming")
 
-        assert output_message.get_data("previous") == "Pass"
+    # Send a message to the input flow
+    send_message_to_flow(
+        test_flow,
+        Message(
+            payload=[
+                {"text": "Chunk1", "last": False},
+                {"text": "Chunk2", "last": False},
+                {"text": "Chunk3", "last": True},
+            ]
+        ),
+    )
 
-    except Exception as e:
-        print(e)
-        assert False
+    # Get the output message
+    output_message = get_message_from_flow(test_flow)
 
-    finally:
-        dispose_connector(connector)
+    assert output_message.get_data("previous") == "Pass"
 
 
 # Test the timeout functionality
-def test_request_response_flow_controller_timeout():
+def test_request_response_flow_controller_timeout(create_requester_flow):
     """Test timeout functionality of the RequestResponseFlowController"""
+    test_flow = create_requester_flow(
+        timeout_invoke_handler, "test_streaming", request_expiry_ms=2000
+    )
 
-    def test_invoke_handler(component, message, data):
-        # # Call the request_response_flow
-        # data_iter = component.send_request_response_flow_message(
-        #     "test_controller", message, {"test": "data"}
-        # )
-
-        # # This will timeout
-        # try:
-        #     for message, data, _last_message in data_iter():
-        #         assert message.get_data("previous") == {"test": "data"}
-        #         assert message.get_data("input.payload") == {"text": "Hello, World!"}
-        # except TimeoutError:
-        #     return "timeout"
-        # return "done"
-
-        # Do it the new way
-        try:
-            for message, _last_message in component.do_broker_request_response(
-                message, stream=True, streaming_complete_expression="input.payload:last"
-            ):
-                pass
-        except TimeoutError:
-            return "Timeout"
-        return "Fail"
-
-    config = {
-        "flows": [
-            {
-                "name": "test_flow",
-                "components": [
-                    {
-                        "component_name": "requester",
-                        "component_module": "handler_callback",
-                        "component_config": {
-                            "invoke_handler": test_invoke_handler,
-                        },
-                        "broker_request_response": {
-                            "enabled": True,
-                            "broker_config": {
-                                "broker_type": "test_streaming",
-                                "broker_url": "test",
-                                "broker_username": "test",
-                                "broker_password": "test",
-                                "broker_vpn": "test",
-                                "payload_encoding": "utf-8",
-                                "payload_format": "json",
-                            },
-                            "request_expiry_ms": 2000,
-                        },
-                    }
-                ],
-            },
-        ]
-    }
-    connector, flows = create_test_flows(config)
-
-    test_flow = flows[0]
+    # Send a message with an empty list in the payload to the test_streaming broker type
+    # This will not send any chunks and should timeout
+    send_message_to_flow(test_flow, Message(payload=[]))
 
-    try:
-
-        # Send a message with an empty list in the payload to the test_streaming broker type
-        # This will not send any chunks and should timeout
-        send_message_to_flow(test_flow, Message(payload=[]))
-
-        # Get the output message
-        output_message = get_message_from_flow(test_flow)
+    # Get the output message
+    output_message = get_message_from_flow(test_flow)
 
-        assert output_message.get_data("previous") == "Timeout"
-
-    finally:
-        dispose_connector(connector)
+    assert output_message.get_data("previous") == "Timeout"
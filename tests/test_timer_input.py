@@ -1,26 +1,28 @@
 """Test the timer input component"""
 
-import sys
-
-sys.path.append("src")
 import time
-import pytest
 
 from solace_ai_connector.test_utils.utils_for_test_files import (
     create_test_flows,
-    create_connector,
     dispose_connector,
-    # send_and_receive_message_on_flow,
-    send_message_to_flow,
     get_message_from_flow,
 )
-from solace_ai_connector.common.message import Message
 from solace_ai_connector.common.log import log
 
+# The timer contract is checked in multiples of the interval, so a short one
+# keeps these tests quick without changing what they check
+INTERVAL_MS = 200
+INTERVAL_S = INTERVAL_MS / 1000
+# Scheduling slack for the timing checks. It scales with the interval but is
+# never less than the checks allowed at the original 500ms interval, so that a
+# busy runner doesn't fail them
+MESSAGE_SLACK_S = max(0.2, 0.4 * INTERVAL_S)
+RUN_SLACK_S = max(0.5, INTERVAL_S)
+
 
 def test_basic_timer():
     """Test the timer input component without a catchup timer"""
-    config_yaml = """
+    config_yaml = f"""
 log:
   log_file_level: DEBUG
   log_file: solace_ai_connector.log
@@ -30,7 +32,7 @@ flows:
       - component_name: timer_input
         component_module: timer_input
         component_config:
-          interval_ms: 500
+          interval_ms: {INTERVAL_MS}
           skip_messages_if_behind: false
   - name: add_timestamp
     components:
@@ -52,16 +54,16 @@ flows:
     flow = flows[0]
 
     try:
-        # Get the output messages (should be at least 3 seconds worth)
+        # Get the output messages (should be at least 6 intervals worth)
         for i in range(6):
             get_message_from_flow(flow)
             current_time = time.time()
-            assert current_time - start_time >= i * 0.5
+            assert current_time - start_time >= i * INTERVAL_S
 
         end_time = time.time()
         duration = end_time - start_time
-        assert duration > 2.5
-        assert duration < 3.5
+        assert duration > 5 * INTERVAL_S
+        assert duration < 6 * INTERVAL_S + RUN_SLACK_S
     finally:
         # Clean up
         dispose_connector(connector)
@@ -69,7 +71,7 @@ flows:
 
 def test_with_no_skip_timer():
     """Create a simple timer input component with a catchup timer."""
-    config_yaml = """
+    config_yaml = f"""
 log:
   log_file_level: DEBUG
   log_file: solace_ai_connector.log
@@ -79,16 +81,16 @@ flows:
       - component_name: timer_input
         component_module: timer_input
         component_config:
-          interval_ms: 500
+          interval_ms: {INTERVAL_MS}
           skip_messages_if_behind: false
 """
 
     connector, flows = create_test_flows(config_yaml, queue_size=1)
     flow = flows[0]
 
-    # Wait for 3 seconds - should get 6 messages quickly
-    log.debug("waiting for 3 seconds")
-    time.sleep(3)
+    # Wait for 6 intervals - should get 6 messages quickly
+    log.debug("waiting for 6 intervals")
+    time.sleep(6 * INTERVAL_S)
     log.debug("done waiting")
 
     # Get the output messages
@@ -100,11 +102,11 @@ flows:
             get_message_from_flow(flow)
             log.debug("got message")
             current_time = time.time()
-            assert current_time - start_time <= (i + 1) * 0.2
+            assert current_time - start_time <= (i + 1) * MESSAGE_SLACK_S
 
         end_time = time.time()
         duration = end_time - start_time
-        assert duration < 0.5
+        assert duration < RUN_SLACK_S
     finally:
         # Clean up
         dispose_connector(connector)
@@ -112,7 +114,7 @@ flows:
 
 def test_with_skip_timer():
     """Create a simple timer input component with a catchup timer."""
-    config_yaml = """
+    config_yaml = f"""
 log:
   log_file_level: DEBUG
   log_file: solace_ai_connector.log
@@ -122,17 +124,17 @@ flows:
       - component_name: timer_input
         component_module: timer_input
         component_config:
-          interval_ms: 500
+          interval_ms: {INTERVAL_MS}
           skip_messages_if_behind: true
 """
 
     connector, flows = create_test_flows(config_yaml, queue_size=1)
     flow = flows[0]
 
-    # Wait for 3 seconds - now the missed messages should be skipped
+    # Wait for 6 intervals - now the missed messages should be skipped
     # There is one in our queue and another one blocked on putting into
-    # the queue. Then the next ones should be spaced by 0.5 seconds each
-    time.sleep(3)
+    # the queue. Then the next ones should be spaced by an interval each
+    time.sleep(6 * INTERVAL_S)
 
     # Get the output messages
     start_time = time.time()
@@ -148,12 +150,12 @@ flows:
             get_message_from_flow(flow)
             log.debug("got message")
             current_time = time.time()
-            assert current_time - start_time >= i * 0.5
+            assert current_time - start_time >= i * INTERVAL_S
 
         end_time = time.time()
         duration = end_time - start_time
-        assert duration > 2.5
-        assert duration < 3.5
+        assert duration > 5 * INTERVAL_S
+        assert duration < 6 * INTERVAL_S + RUN_SLACK_S
     finally:
         # Clean up
         dispose_connector(connector)
@@ -1,20 +1,36 @@
 """This file tests the input_transforms configuration and execution"""
 
-import sys
+import pytest
 
-sys.path.append("src")
-
-from solace_ai_connector.test_utils.utils_for_test_files import (  # pylint: disable=wrong-import-position
+from solace_ai_connector.test_utils.utils_for_test_files import (
     create_connector,
     create_and_run_component,
     run_component_test,
     # dispose_connector,
 )
-from solace_ai_connector.common.message import (  # pylint: disable=wrong-import-position
+from solace_ai_connector.common.message import (
     Message,
 )
 import solace_ai_connector.components.general.pass_through
 
+# Used by the run_component_test tests - the connector doesn't modify them
+GREETING_TRANSFORMS = [
+    {
+        "type": "copy",
+        "source_expression": "input.payload",
+        "dest_expression": "user_data.temp:payload",
+    },
+    {
+        "type": "copy",
+        "source_value": "Static Greeting!",
+        "dest_expression": "user_data.temp:payload.greeting",
+    },
+]
+GREETING_SELECTION = {"source_expression": "user_data.temp:payload.text"}
+GREETING_USER_DATA = {
+    "payload": {"text": "Hello, World!", "greeting": "Static Greeting!"}
+}
+
 
 def test_basic_copy_transform():
     """Test the basic copy transform"""
@@ -46,61 +62,28 @@ flows:
     assert output_message.get_data("previous") == "Hello, World!"
 
 
-def test_transform_with_run_component_test():
-    """This test is actually testing the test infrastructure method: run_component_test"""
-
-    def validation_func(output_data, output_message, _input_message):
-        assert output_data[0] == "Hello, World!"
-        assert output_message[0].get_data("user_data.temp") == {
-            "payload": {"text": "Hello, World!", "greeting": "Static Greeting!"}
-        }
-
-    run_component_test(
-        "pass_through",
-        validation_func,
-        input_data={"text": "Hello, World!"},
-        input_transforms=[
-            {
-                "type": "copy",
-                "source_expression": "input.payload",
-                "dest_expression": "user_data.temp:payload",
-            },
-            {
-                "type": "copy",
-                "source_value": "Static Greeting!",
-                "dest_expression": "user_data.temp:payload.greeting",
-            },
-        ],
-        input_selection={"source_expression": "user_data.temp:payload.text"},
-    )
-
-
-def test_transform_with_run_component_test_with_static_import():
+@pytest.mark.parametrize(
+    "module_or_name",
+    [
+        pytest.param("pass_through", id="module_name"),
+        pytest.param(
+            solace_ai_connector.components.general.pass_through, id="static_import"
+        ),
+    ],
+)
+def test_transform_with_run_component_test(module_or_name):
     """This test is actually testing the test infrastructure method: run_component_test"""
 
     def validation_func(output_data, output_message, _input_message):
         assert output_data == ["Hello, World!"]
-        assert output_message[0].get_data("user_data.temp") == {
-            "payload": {"text": "Hello, World!", "greeting": "Static Greeting!"}
-        }
+        assert output_message[0].get_data("user_data.temp") == GREETING_USER_DATA
 
     run_component_test(
-        solace_ai_connector.components.general.pass_through,
+        module_or_name,
         validation_func,
         input_data={"text": "Hello, World!"},
-        input_transforms=[
-            {
-                "type": "copy",
-                "source_expression": "input.payload",
-                "dest_expression": "user_data.temp:payload",
-            },
-            {
-                "type": "copy",
-                "source_value": "Static Greeting!",
-                "dest_expression": "user_data.temp:payload.greeting",
-            },
-        ],
-        input_selection={"source_expression": "user_data.temp:payload.text"},
+        input_transforms=GREETING_TRANSFORMS,
+        input_selection=GREETING_SELECTION,
     )
 
 
@@ -276,87 +259,62 @@ flows:
     assert output_message.get_data("previous") == {"my_list": [1]}
 
 
-def test_transform_without_a_type():
-    """Test that the program exits if a transform does not have a type"""
-    try:
-        config_yaml = """
-flows:
-  - name: test_flow
-    components:
-      - component_name: pass_through
-        component_module: pass_through
-        input_transforms:
-          - source_expression: input.payload:one
-            dest_expression: user_data.temp:my_list
-        input_selection:
-          source_expression: user_data.temp
-"""
-        create_connector(config_yaml)
-    except ValueError as e:
-        assert str(e) == "Transform at index 0 does not have a type"
-
-
-def test_transform_with_unknown_type():
-    """Test that the program exits if a transform has an unknown type"""
-    try:
-        config_yaml = """
-flows:
-  - name: test_flow
-    components:
-      - component_name: pass_through
-        component_module: pass_through
-        input_transforms:
-          - type: unknown
-            source_expression: input.payload:one
-            dest_expression: user_data.temp:my_list
-        input_selection:
-          source_expression: user_data.temp
-"""
-        create_connector(config_yaml)
-    except ValueError as e:
-        assert str(e) == "Transform at index 0 has an unknown type: unknown"
-
-
-def test_missing_source_expression():
-    """Test that the program exits if no source expression is provided"""
-    try:
-        config_yaml = """
-instance_name: test_instance
-flows:
-  - name: test_flow
-    components:
-      - component_name: pass_through
-        component_module: pass_through
-        input_transforms:
-          - type: copy
-            dest_expression: user_data.temp:my_list
-        input_selection:
-          source_expression: user_data.temp
-"""
-        create_connector(config_yaml)
-    except ValueError as e:
-        assert str(e).endswith("Transform does not have a source expression")
-
-
-def test_missing_dest_expression():
-    """Test that the program exits if no dest expression is provided"""
-    try:
-        config_yaml = """
-instance_name: test_instance
-flows:
-  - name: test_flow
-    components:
-      - component_name: pass_through
-        component_module: pass_through
-        input_transforms:
-          - type: copy
-            source_expression: input.payload:one
-        input_selection:
-          source_expression: user_data.temp
-"""
-        create_connector(config_yaml)
-    except ValueError as e:
-        assert str(e).endswith("Transform does not have a dest expression")
+# Each case is an input transform that fails validation and the error it raises
+INVALID_TRANSFORMS = [
+    pytest.param(
+        {
+            "source_expression": "input.payload:one",
+            "dest_expression": "user_data.temp:my_list",
+        },
+        "Transform at index 0 does not have a type",
+        id="no_type",
+    ),
+    pytest.param(
+        {
+            "type": "unknown",
+            "source_expression": "input.payload:one",
+            "dest_expression": "user_data.temp:my_list",
+        },
+        "Transform at index 0 has an unknown type: unknown",
+        id="unknown_type",
+    ),
+    pytest.param(
+        {"type": "copy", "dest_expression": "user_data.temp:my_list"},
+        "[test_instance.test_flow.pass_through] : "
+        "Transform does not have a source expression",
+        id="no_source_expression",
+    ),
+    pytest.param(
+        {"type": "copy", "source_expression": "input.payload:one"},
+        "[test_instance.test_flow.pass_through] : "
+        "Transform does not have a dest expression",
+        id="no_dest_expression",
+    ),
+]
+
+
+@pytest.mark.parametrize("transform,expected_error", INVALID_TRANSFORMS)
+def test_invalid_transform(transform, expected_error):
+    """Test that the program exits if a transform is invalid"""
+    config = {
+        "instance_name": "test_instance",
+        "flows": [
+            {
+                "name": "test_flow",
+                "components": [
+                    {
+                        "component_name": "pass_through",
+                        "component_module": "pass_through",
+                        "input_transforms": [transform],
+                        "input_selection": {"source_expression": "user_data.temp"},
+                    }
+                ],
+            }
+        ],
+    }
+    with pytest.raises(ValueError) as e:
+        create_connector(config)
+    assert str(e.value) == expected_error
 
 
 def test_source_value_as_an_object():